@@ -32,9 +32,18 @@ class BaseTournamentFormat(ABC):
         """Handle tournament completion and winner determination"""
         pass
     
+    async def _send(self, ctx, *, embed: discord.Embed, followup: bool = False):
+        """Send an embed through the right channel for commands and interactions"""
+        response = getattr(ctx, 'response', None)
+        if response is None:
+            return await ctx.send(embed=embed)
+        if followup:
+            return await ctx.followup.send(embed=embed)
+        return await response.send_message(embed=embed)
+    
     def _calculate_total_rounds(self, player_count: int) -> int:
         """Calculate the total number of rounds needed for a bracket"""
-        import math
         if player_count <= 1:
             return 0
-        return math.ceil(math.log2(player_count))
+        # (n - 1).bit_length() == ceil(log2(n)) for n >= 2, without float rounding
+        return (player_count - 1).bit_length()
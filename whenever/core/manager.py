@@ -1,5 +1,7 @@
 from discord.ext import commands
 import discord
+import asyncio
+from collections import ChainMap, OrderedDict
 from typing import Dict, Optional, List, Union, Any
 from datetime import datetime
 
@@ -24,34 +26,63 @@ from ..services.scheduling import SchedulingService
 
 from .models import Tournament, Match, Participant
 
+MAX_CACHED_TOURNAMENTS = 64  # Guild tournaments kept in memory; the rest are loaded from backups on use
+
 
 class TournamentManager:
     """
     Core orchestrator for tournament management that delegates to specialized services.
     """
+    __slots__ = (
+        "bot", "logger", "backup", "guild_settings",
+        "_role_cache", "registration_service", "match_service", "bracket_service",
+        "scheduling_service", "format_handlers", "_tournaments", "_loading"
+    )
     def __init__(self, bot: commands.Bot, logger: TournamentLogger, backup: TournamentBackup):
         self.bot = bot
         self.logger = logger
         self.backup = backup
         self.guild_settings = {}
+        # Resolved tournament role per guild, keyed by (guild_id, role_id) so a new role setting misses
+        self._role_cache: Dict[tuple, Optional[discord.Role]] = {}
         self.registration_service = RegistrationService(bot, logger, backup)
         self.match_service = MatchService(bot, logger, backup)
         self.bracket_service = BracketService(bot, logger)
-        self.scheduling_service = SchedulingService(bot, logger, backup)
+        self.scheduling_service = SchedulingService(
+            bot, logger, backup, self.guild_settings, self.bracket_service, self._get_tournament
+        )
         self.format_handlers = {
             TournamentMode.SINGLE_ELIMINATION: SingleEliminationTournament(bot, logger, backup),
             TournamentMode.DOUBLE_ELIMINATION: DoubleEliminationTournament(bot, logger, backup),
             TournamentMode.SWISS: SwissTournament(bot, logger, backup),
             TournamentMode.ROUND_ROBIN: RoundRobinTournament(bot, logger, backup)
         }
-        self.current_tournament: Optional[Tournament] = None
+        # Tournament per guild, least recently used first; None marks a guild with no backup
+        self._tournaments: "OrderedDict[int, Optional[Tournament]]" = OrderedDict()
+        # Backup loads in progress, shared by every command that misses the cache for the guild
+        self._loading: Dict[int, asyncio.Task] = {}
     async def load_states(self, guilds: List[discord.Guild]):
         """Load tournament states for all guilds"""
-        for guild in guilds:
-            state = self.backup.load_tournament_state(guild.id)
+        # Queue every guild's backup read up front, then restore them in order
+        states = await asyncio.gather(
+            *(self.backup.load_tournament_state_async(guild.id) for guild in guilds),
+            return_exceptions=True
+        )
+        for guild, state in zip(guilds, states):
+            if isinstance(state, Exception):
+                self.logger.log_error(
+                    guild.id,
+                    "state_restore_failed",
+                    f"Failed to restore state: {str(state)}"
+                )
+                continue
+            if guild.id in self._tournaments:
+                continue  # A command already loaded (or replaced) this guild's tournament
             if state:
+                if not state.get("tournament_meta"):
+                    continue  # No tournament was saved for this guild
                 try:
-                    self.current_tournament = Tournament.from_dict(state)
+                    self._set_tournament(guild.id, Tournament.from_dict(state))
                     self.logger.log_tournament_event(
                         guild.id,
                         "state_restored",
@@ -64,6 +95,45 @@ class TournamentManager:
                         f"Failed to restore state: {str(e)}"
                     )
 
+    async def _get_tournament(self, guild_id: int) -> Optional[Tournament]:
+        """Get the guild's tournament, loading it from its backup if it is not cached"""
+        if guild_id in self._tournaments:
+            self._tournaments.move_to_end(guild_id)
+            return self._tournaments[guild_id]
+        task = self._loading.get(guild_id)
+        if task is None:
+            task = self._loading[guild_id] = asyncio.create_task(self._load_tournament(guild_id))
+            task.add_done_callback(lambda _: self._loading.pop(guild_id, None))
+        # Shielded so one cancelled command doesn't cancel the load for the others waiting on it
+        return await asyncio.shield(task)
+    async def _load_tournament(self, guild_id: int) -> Optional[Tournament]:
+        """Load the guild's tournament from its backup into the cache"""
+        tournament = None
+        try:
+            state = await self.backup.load_tournament_state_async(guild_id)
+            if state.get("tournament_meta"):
+                tournament = Tournament.from_dict(state)
+        except Exception as e:
+            self.logger.log_error(guild_id, "state_restore_failed", f"Failed to restore state: {str(e)}")
+        if guild_id in self._tournaments:
+            # Cached while the backup was read, e.g. by the startup load or a new tournament
+            return self._tournaments[guild_id]
+        self._set_tournament(guild_id, tournament)
+        return tournament
+    def _set_tournament(self, guild_id: int, tournament: Optional[Tournament]):
+        """Cache the guild's tournament, evicting the least recently used guilds over the limit"""
+        self._tournaments[guild_id] = tournament
+        self._tournaments.move_to_end(guild_id)
+        while len(self._tournaments) > MAX_CACHED_TOURNAMENTS:
+            evicted_id, evicted = self._tournaments.popitem(last=False)
+            # Write any coalesced save now; the tournament is reloaded from its backup when needed
+            self.backup.flush(evicted_id)
+            if evicted is not None:
+                self.bracket_service.forget_tournament(evicted)
+    def get_tournament_config(self, guild_id: int) -> ChainMap:
+        """Get a guild's tournament settings: its config command overrides over the shared defaults"""
+        overrides = self.guild_settings.get(guild_id, {}).get("tournament_config") or {}
+        return ChainMap(overrides, DEFAULT_TOURNAMENT_CONFIG)
     async def get_tournament_role(self, guild_id: int) -> Optional[discord.Role]:
         """Get the tournament role for a guild"""
         if guild_id not in self.guild_settings:
@@ -71,18 +141,25 @@ class TournamentManager:
         role_id = self.guild_settings[guild_id].get("tournament_role_id")
         if not role_id:
             return None
+        key = (guild_id, role_id)
+        if key in self._role_cache:
+            return self._role_cache[key]
         guild = self.bot.get_guild(guild_id)
         if not guild:
             return None
-        return guild.get_role(role_id)
-    async def get_announcement_channel(self, guild_id: int) -> Optional[discord.TextChannel]:
-        """Get the announcement channel for a guild"""
+        role = self._role_cache[key] = guild.get_role(role_id)
+        return role
+    def forget_role(self, role: discord.Role):
+        """Drop a cached role after it was changed or deleted"""
+        self._role_cache.pop((role.guild.id, role.id), None)
+    async def get_announcement_channel(self, guild_id: int) -> Optional[discord.PartialMessageable]:
+        """Get a sendable handle to the announcement channel for a guild, without a cache lookup"""
         if guild_id not in self.guild_settings:
             return None
         channel_id = self.guild_settings[guild_id].get("announcement_channel_id")
         if not channel_id:
             return None
-        return self.bot.get_channel(channel_id)
+        return self.bot.get_partial_messageable(channel_id, guild_id=guild_id)
     async def send_tournament_announcement(self, guild_id: int, embed: discord.Embed, mention_role: bool = False):
         """Send an announcement to the tournament announcement channel"""
         # Implementation remains similar but simplified
@@ -105,29 +182,32 @@ class TournamentManager:
             )
     async def create_tournament(self, ctx, name: str, description: str = "", **kwargs):
         """Create a new tournament with the specified settings"""
-        if self.current_tournament and self.current_tournament.is_started:
+        tournament = await self._get_tournament(ctx.guild.id)
+        if tournament and tournament.is_started:
             await ctx.send("A tournament is already in progress!")
             return False
         tournament_mode = kwargs.get("tournament_mode", TournamentMode.SINGLE_ELIMINATION)
         if tournament_mode not in self.format_handlers:
             await ctx.send(f"Invalid tournament mode: {tournament_mode}")
             return False
-        self.current_tournament = Tournament(
+        tournament = Tournament(
             name=name,
             description=description,
             guild_id=ctx.guild.id,
             created_by=ctx.author.id if hasattr(ctx, 'author') else ctx.user.id,
             tournament_mode=tournament_mode,
+            config=self.get_tournament_config(ctx.guild.id),
             **kwargs
         )
-        self.backup.save_tournament_state(ctx.guild.id, self.current_tournament.to_dict())
+        self._set_tournament(ctx.guild.id, tournament)
+        await self.backup.save_tournament_state_async(ctx.guild.id, tournament.to_dict())
         self.logger.log_tournament_event(
             ctx.guild.id,
             "tournament_created",
             {
                 "name": name,
                 "tournament_mode": tournament_mode,
-                "config": self.current_tournament.config
+                "config": tournament.config
             }
         )
         embed = discord.Embed(
@@ -141,11 +221,11 @@ class TournamentManager:
         )
         embed.add_field(
             name="Best of",
-            value=str(self.current_tournament.config.get("best_of", 3))
+            value=str(tournament.config.get("best_of", 3))
         )
         embed.add_field(
             name="Deck Check",
-            value="Required" if self.current_tournament.config.get("deck_check_required") else "Not Required"
+            value="Required" if tournament.config.get("deck_check_required") else "Not Required"
         )
         is_interaction = hasattr(ctx, 'response')
         if is_interaction:
@@ -155,17 +235,19 @@ class TournamentManager:
         return True
     async def open_registration(self, ctx):
         """Open registration for the tournament"""
-        if not self.current_tournament:
+        tournament = await self._get_tournament(ctx.guild.id)
+        if not tournament:
             await ctx.send("No tournament has been created yet!")
             return False
-        if self.current_tournament.is_started:
+        if tournament.is_started:
             await ctx.send("Tournament has already started!")
             return False
-        self.current_tournament.registration_open = True
-        self.current_tournament.meta["current_phase"] = "registration"
-        self.backup.save_tournament_state(
+        tournament.registration_open = True
+        tournament.meta["current_phase"] = "registration"
+        tournament.mark_changed()
+        await self.backup.save_tournament_state_async(
             ctx.guild.id,
-            self.current_tournament.to_dict()
+            tournament.to_dict()
         )
         is_interaction = hasattr(ctx, 'response')
         user = ctx.user if is_interaction else ctx.author
@@ -178,7 +260,7 @@ class TournamentManager:
             }
         )
         embed = discord.Embed(
-            title=f"Registration Open for {self.current_tournament.name}",
+            title=f"Registration Open for {tournament.name}",
             description="Players can now register for the tournament!",
             color=discord.Color.green()
         )
@@ -190,12 +272,13 @@ class TournamentManager:
 
     async def register_player(self, ctx, main_deck=None, extra_deck=None, side_deck=None):
         """Register a player for the tournament - delegates to registration service"""
-        if not self.current_tournament:
+        tournament = await self._get_tournament(ctx.guild.id)
+        if not tournament:
             await ctx.send("No tournament has been created yet!")
             return False
         await self.registration_service.register_player(
             ctx,
-            self.current_tournament,
+            tournament,
             main_deck,
             extra_deck,
             side_deck
@@ -203,36 +286,39 @@ class TournamentManager:
 
     async def start_tournament(self, ctx):
         """Start the tournament with registered participants"""
-        if not self.current_tournament:
+        tournament = await self._get_tournament(ctx.guild.id)
+        if not tournament:
             await ctx.send("No tournament has been created yet!")
             return False
-        if self.current_tournament.is_started:
+        if tournament.is_started:
             await ctx.send("Tournament has already started!")
             return False
-        if len(self.current_tournament.participants) < MIN_PARTICIPANTS:
-            await ctx.send(f"Not enough participants (minimum {MIN_PARTICIPANTS}, current: {len(self.current_tournament.participants)})")
+        if len(tournament.participants) < MIN_PARTICIPANTS:
+            await ctx.send(f"Not enough participants (minimum {MIN_PARTICIPANTS}, current: {len(tournament.participants)})")
             return False
-        format_handler = self.format_handlers[self.current_tournament.config["tournament_mode"]]
-        success = await format_handler.start_tournament(ctx, self.current_tournament)
+        format_handler = self.format_handlers[tournament.config["tournament_mode"]]
+        success = await format_handler.start_tournament(ctx, tournament)
         if success:
-            self.current_tournament.is_started = True
-            self.current_tournament.registration_open = False
-            self.current_tournament.meta["start_time"] = datetime.now().isoformat()
-            self.backup.save_tournament_state(
+            tournament.is_started = True
+            tournament.registration_open = False
+            tournament.meta["start_time"] = datetime.now().isoformat()
+            tournament.mark_changed()
+            await self.backup.save_tournament_state_async(
                 ctx.guild.id,
-                self.current_tournament.to_dict()
+                tournament.to_dict()
             )
             await self.send_bracket_status(ctx)
         return success
 
     async def report_result(self, ctx, opponent, wins, losses, draws=0):
         """Report a match result - delegates to match service"""
-        if not self.current_tournament or not self.current_tournament.is_started:
+        tournament = await self._get_tournament(ctx.guild.id)
+        if not tournament or not tournament.is_started:
             await ctx.send("No tournament is currently in progress!")
             return False
         result = await self.match_service.report_result(
             ctx,
-            self.current_tournament,
+            tournament,
             opponent,
             wins,
             losses,
@@ -243,20 +329,23 @@ class TournamentManager:
         return result
     async def check_round_completion(self, ctx):
         """Check if the current round is complete and start the next round if needed"""
-        if not self.current_tournament or not self.current_tournament.is_started:
+        tournament = await self._get_tournament(ctx.guild.id)
+        if not tournament or not tournament.is_started:
             return
-        format_handler = self.format_handlers[self.current_tournament.config["tournament_mode"]]
-        await format_handler.check_round_completion(ctx, self.current_tournament)
-        self.backup.save_tournament_state(
+        format_handler = self.format_handlers[tournament.config["tournament_mode"]]
+        await format_handler.check_round_completion(ctx, tournament)
+        tournament.mark_changed()
+        await self.backup.save_tournament_state_async(
             ctx.guild.id,
-            self.current_tournament.to_dict()
+            tournament.to_dict()
         )
     async def send_bracket_status(self, ctx, send_to_announcement=False):
         """Send the current bracket status - delegates to bracket service"""
-        if not self.current_tournament:
+        tournament = await self._get_tournament(ctx.guild.id)
+        if not tournament:
             await ctx.send("No tournament has been created yet!")
             return
-        embed = await self.bracket_service.create_bracket_embed(ctx, self.current_tournament)
+        embed = await self.bracket_service.create_bracket_embed(ctx, tournament)
         if embed:
             is_interaction = hasattr(ctx, 'response')
             if is_interaction:
@@ -267,27 +356,30 @@ class TournamentManager:
                 await self.send_tournament_announcement(ctx.guild.id, embed, False)
     async def schedule_player_match(self, ctx, opponent, time_str):
         """Schedule a match with an opponent - delegates to scheduling service"""
-        if not self.current_tournament or not self.current_tournament.is_started:
+        tournament = await self._get_tournament(ctx.guild.id)
+        if not tournament or not tournament.is_started:
             await ctx.send("No tournament is currently in progress!")
             return False
         return await self.scheduling_service.schedule_match(
             ctx,
-            self.current_tournament,
+            tournament,
             opponent,
             time_str
         )
     async def show_upcoming_matches(self, ctx):
         """Show upcoming scheduled matches - delegates to scheduling service"""
-        if not self.current_tournament or not self.current_tournament.is_started:
+        tournament = await self._get_tournament(ctx.guild.id)
+        if not tournament or not tournament.is_started:
             await ctx.send("No tournament is currently in progress!")
             return False
-        return await self.scheduling_service.show_upcoming_matches(ctx, self.current_tournament)
+        return await self.scheduling_service.show_upcoming_matches(ctx, tournament)
     async def get_tournament_stats(self, ctx):
         """Generate tournament statistics"""
-        if not self.current_tournament:
+        tournament = await self._get_tournament(ctx.guild.id)
+        if not tournament:
             await ctx.send("No tournament has been created yet!")
             return
-        embed = await self.bracket_service.create_stats_embed(ctx, self.current_tournament)
+        embed = await self.bracket_service.create_stats_embed(ctx, tournament)
         is_interaction = hasattr(ctx, 'response')
         if is_interaction:
             await ctx.response.send_message(embed=embed)
@@ -295,12 +387,13 @@ class TournamentManager:
             await ctx.send(embed=embed)
     async def disqualify_player(self, ctx, player, reason="Disqualified by moderator"):
         """Disqualify a player from the tournament"""
-        if not self.current_tournament or not self.current_tournament.is_started:
+        tournament = await self._get_tournament(ctx.guild.id)
+        if not tournament or not tournament.is_started:
             await ctx.send("No tournament is currently in progress!")
             return False
         result = await self.match_service.disqualify_player(
             ctx,
-            self.current_tournament,
+            tournament,
             player,
             reason
         )
@@ -1,6 +1,11 @@
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple
 from datetime import datetime
+import copy
+import heapq
+import itertools
+import sys
 import uuid
+from operator import attrgetter
 
 from ..utils.constants import (
     DEFAULT_TOURNAMENT_CONFIG,
@@ -12,6 +17,10 @@ from ..utils.constants import (
 
 class DeckInfo:
     """Represents player's deck information"""
+    __slots__ = (
+        "main_deck_url", "extra_deck_url", "side_deck_url", "verification_status",
+        "verification_notes", "verified_by", "verified_at"
+    )
     def __init__(
         self,
         main_deck_url: Optional[str] = None,
@@ -47,7 +56,7 @@ class DeckInfo:
             main_deck_url=data.get("main_deck_url"),
             extra_deck_url=data.get("extra_deck_url"),
             side_deck_url=data.get("side_deck_url"),
-            verification_status=data.get("verification_status", VerificationStatus.PENDING),
+            verification_status=sys.intern(data.get("verification_status", VerificationStatus.PENDING)),
             verification_notes=data.get("verification_notes"),
             verified_by=data.get("verified_by"),
             verified_at=data.get("verified_at")
@@ -56,6 +65,11 @@ class DeckInfo:
 
 class Participant:
     """Represents a tournament participant"""
+    __slots__ = (
+        "_standings_owner", "_record_str", "_standings_line", "user_id", "deck_info",
+        "_wins", "_losses", "_draws", "_match_points", "_tiebreaker_points", "seed",
+        "registration_time", "dq_info", "active"
+    )
     def __init__(
         self,
         user_id: int,
@@ -70,6 +84,9 @@ class Participant:
         dq_info: Optional[Dict[str, Any]] = None,
         active: bool = True
     ):
+        self._standings_owner: Optional['Tournament'] = None
+        self._record_str: Optional[str] = None
+        self._standings_line: Optional[str] = None
         self.user_id = user_id
         self.deck_info = deck_info
         self.wins = wins
@@ -81,6 +98,64 @@ class Participant:
         self.registration_time = registration_time or datetime.now().isoformat()
         self.dq_info = dq_info
         self.active = active
+    @property
+    def wins(self) -> int:
+        return self._wins
+    @wins.setter
+    def wins(self, value: int):
+        self._wins = value
+        self._record_str = self._standings_line = None
+        self._stats_changed(False)
+    @property
+    def losses(self) -> int:
+        return self._losses
+    @losses.setter
+    def losses(self, value: int):
+        self._losses = value
+        self._record_str = self._standings_line = None
+        self._stats_changed(False)
+    @property
+    def draws(self) -> int:
+        return self._draws
+    @draws.setter
+    def draws(self, value: int):
+        self._draws = value
+        self._standings_line = None
+        self._stats_changed(False)
+    @property
+    def match_points(self) -> int:
+        return self._match_points
+    @match_points.setter
+    def match_points(self, value: int):
+        self._match_points = value
+        self._standings_line = None
+        self._stats_changed(True)
+    @property
+    def tiebreaker_points(self) -> float:
+        return self._tiebreaker_points
+    @tiebreaker_points.setter
+    def tiebreaker_points(self, value: float):
+        self._tiebreaker_points = value
+        self._stats_changed(True)
+    def _stats_changed(self, reranks: bool):
+        """Invalidate the owning tournament's rendered views, and its ranking if the order may change"""
+        owner = self._standings_owner
+        if owner is not None:
+            if reranks:
+                owner._standings_dirty = True
+            owner.mark_changed()
+    @property
+    def record_str(self) -> str:
+        """Win-loss record such as 3-1"""
+        if self._record_str is None:
+            self._record_str = f"{self._wins}-{self._losses}"
+        return self._record_str
+    @property
+    def standings_line(self) -> str:
+        """Points and win-loss-draw record as shown in standings"""
+        if self._standings_line is None:
+            self._standings_line = f"{self._match_points} pts ({self._wins}-{self._losses}-{self._draws})"
+        return self._standings_line
     def to_dict(self) -> Dict[str, Any]:
         """Convert Participant to dictionary"""
         return {
@@ -92,7 +167,7 @@ class Participant:
             "tiebreaker_points": self.tiebreaker_points,
             "seed": self.seed,
             "registration_time": self.registration_time,
-            "dq_info": self.dq_info,
+            "dq_info": dict(self.dq_info) if self.dq_info else self.dq_info,
             "active": self.active
         }
     @classmethod
@@ -118,6 +193,11 @@ class Participant:
 
 class Match:
     """Represents a tournament match"""
+    __slots__ = (
+        "match_id", "player1", "player2", "round_num", "bracket", "score", "winner",
+        "loser", "status", "_scheduled_time", "_sched_ts", "_sched_ts_parsed",
+        "_sched_markers", "completed_time", "reported_by", "confirmed_by"
+    )
     def __init__(
         self,
         match_id: int,
@@ -147,6 +227,35 @@ class Match:
         self.completed_time = completed_time
         self.reported_by = reported_by
         self.confirmed_by = confirmed_by
+    @property
+    def scheduled_time(self) -> Optional[str]:
+        return self._scheduled_time
+    @scheduled_time.setter
+    def scheduled_time(self, value: Optional[str]):
+        self._scheduled_time = value
+        self._sched_ts = None
+        self._sched_ts_parsed = False
+        self._sched_markers: Dict[str, str] = {}
+    @property
+    def scheduled_unix_ts(self) -> Optional[int]:
+        """Scheduled time as a Unix timestamp, parsed once per scheduled_time value"""
+        if not self._sched_ts_parsed:
+            self._sched_ts_parsed = True
+            if self._scheduled_time:
+                try:
+                    self._sched_ts = int(datetime.fromisoformat(self._scheduled_time).timestamp())
+                except ValueError:
+                    self._sched_ts = None
+        return self._sched_ts
+    def schedule_marker(self, style: str = "F") -> Optional[str]:
+        """Discord timestamp markup (<t:...:style>) for the scheduled time, rendered once per style"""
+        marker = self._sched_markers.get(style)
+        if marker is None:
+            timestamp = self.scheduled_unix_ts
+            if timestamp is None:
+                return None
+            marker = self._sched_markers[style] = f"<t:{timestamp}:{style}>"
+        return marker
     def to_dict(self) -> Dict[str, Any]:
         """Convert Match to dictionary"""
         return {
@@ -171,11 +280,12 @@ class Match:
             player1=data.get("player1"),
             player2=data.get("player2"),
             round_num=data.get("round"),
-            bracket=data.get("bracket"),
+            # Interned so status/bracket compares against the constants hit the identity fast path
+            bracket=sys.intern(data["bracket"]) if data.get("bracket") else data.get("bracket"),
             score=data.get("score"),
             winner=data.get("winner"),
             loser=data.get("loser"),
-            status=data.get("status", MatchStatus.PENDING),
+            status=sys.intern(data.get("status", MatchStatus.PENDING)),
             scheduled_time=data.get("scheduled_time"),
             completed_time=data.get("completed_time"),
             reported_by=data.get("reported_by"),
@@ -183,6 +293,17 @@ class Match:
         )
 
 
+# Match statuses that still count towards a round's pending matches
+_UNFINISHED_STATUSES = frozenset({MatchStatus.PENDING, MatchStatus.AWAITING_CONFIRMATION})
+
+# Render versions shared by every tournament, so a version number is never handed out twice,
+# even to a tournament rebuilt from its backup
+_render_versions = itertools.count(1)
+
+# Sort key ranking participants by match points, then tiebreakers
+_standings_key = attrgetter("match_points", "tiebreaker_points")
+
+
 class Tournament:
     """Represents a tournament with all its data"""
     def __init__(
@@ -209,7 +330,16 @@ class Tournament:
         self.registration_open = False
         self.current_round = 1
         self.participants: Dict[int, Participant] = {}
+        self._total_rounds: Optional[int] = None
+        self._standings_cache: List[Tuple[int, Participant]] = []
+        self._standings_dirty = True
         self.matches: Dict[int, Match] = {}
+        self._matches_by_round_bracket: Dict[Tuple[int, str], List[Match]] = {}
+        self._matches_by_player: Dict[int, List[Match]] = {}
+        self._indexed_match_count = 0
+        # Unfinished matches per round and bracket, derived from match statuses and never saved
+        self._pending: Dict[int, Dict[str, int]] = {}
+        self._render_version = next(_render_versions)
         self.meta = {
             "id": str(uuid.uuid4()),
             "name": name,
@@ -219,12 +349,13 @@ class Tournament:
             "current_phase": "registration",
             "created_by": created_by,
             "current_match_id": 1,
+            "next_seed": 1,
             "guild_id": guild_id,
             "scheduled_matches": {},
             "reminder_tasks": {}
         }
     def to_dict(self) -> Dict[str, Any]:
-        """Convert Tournament to dictionary"""
+        """Convert Tournament to dictionary, copying everything so later changes don't leak into it"""
         participants_dict = {}
         for user_id, participant in self.participants.items():
             participants_dict[str(user_id)] = participant.to_dict()
@@ -232,8 +363,8 @@ class Tournament:
         for match_id, match in self.matches.items():
             matches_dict[str(match_id)] = match.to_dict()
         return {
-            "tournament_config": self.config,
-            "tournament_meta": self.meta,
+            "tournament_config": dict(self.config),
+            "tournament_meta": copy.deepcopy(self.meta),
             "tournament_started": self.is_started,
             "registration_open": self.registration_open,
             "current_round": self.current_round,
@@ -244,32 +375,172 @@ class Tournament:
     def from_dict(cls, data: Dict[str, Any]) -> 'Tournament':
         """Create Tournament from dictionary"""
         meta = data.get("tournament_meta", {})
+        config = data.get("tournament_config") or {}
         tournament = cls(
             name=meta.get("name", "Tournament"),
             description=meta.get("description", ""),
             guild_id=meta.get("guild_id"),
             created_by=meta.get("created_by"),
-            config=data.get("tournament_config")
+            # Interned so format handler lookups and mode compares reuse the constant's hash
+            tournament_mode=sys.intern(config.get("tournament_mode", TournamentMode.SINGLE_ELIMINATION)),
+            config=config
         )
         tournament.is_started = data.get("tournament_started", False)
         tournament.registration_open = data.get("registration_open", False)
         tournament.current_round = data.get("current_round", 1)
         tournament.meta = meta
+        # Older backups saved pending counters; they are recounted from match statuses instead
+        meta.pop("pending_by_round", None)
         participants_dict = data.get("participants", {})
         for user_id_str, participant_data in participants_dict.items():
             user_id = int(user_id_str)
-            tournament.participants[user_id] = Participant.from_dict(user_id, participant_data)
+            tournament.add_participant(Participant.from_dict(user_id, participant_data))
         matches_dict = data.get("matches", {})
         for match_id_str, match_data in matches_dict.items():
             match_id = int(match_id_str)
-            tournament.matches[match_id] = Match.from_dict(match_id, match_data)
+            tournament.add_match(Match.from_dict(match_id, match_data))
         return tournament
+    def add_participant(self, participant: Participant):
+        """Add a participant whose stat changes invalidate this tournament's standings and embeds"""
+        participant._standings_owner = self
+        self.participants[participant.user_id] = participant
     def get_active_participants(self) -> List[Participant]:
         """Get list of active participants"""
         return [p for p in self.participants.values() if p.active]
+    @property
+    def render_version(self) -> int:
+        """Version that changes whenever state shown in bracket embeds changes; never reused"""
+        return self._render_version
+    def mark_changed(self):
+        """Invalidate rendered views of this tournament"""
+        self._render_version = next(_render_versions)
+    def add_match(self, match: Match):
+        """Add a match to the tournament and its round/bracket index"""
+        previous = self.matches.get(match.match_id)
+        replaced = previous is not None
+        self.matches[match.match_id] = match
+        self._render_version = next(_render_versions)
+        if replaced and previous.status in _UNFINISHED_STATUSES:
+            self._untrack_pending(previous)
+        if match.status in _UNFINISHED_STATUSES:
+            self._track_pending(match)
+        if replaced or self._indexed_match_count != len(self.matches) - 1:
+            # Index is out of sync - rebuild it on the next lookup
+            self._indexed_match_count = -1
+            return
+        self._matches_by_round_bracket.setdefault((match.round_num, match.bracket), []).append(match)
+        self._matches_by_player.setdefault(match.player1, []).append(match)
+        self._matches_by_player.setdefault(match.player2, []).append(match)
+        self._indexed_match_count += 1
+    def _rebuild_match_index(self):
+        """Rebuild the round/bracket and player indexes from scratch"""
+        index: Dict[Tuple[int, str], List[Match]] = {}
+        by_player: Dict[int, List[Match]] = {}
+        pending: Dict[int, Dict[str, int]] = {}
+        for match in self.matches.values():
+            index.setdefault((match.round_num, match.bracket), []).append(match)
+            by_player.setdefault(match.player1, []).append(match)
+            by_player.setdefault(match.player2, []).append(match)
+            if match.status in _UNFINISHED_STATUSES:
+                brackets = pending.setdefault(match.round_num, {})
+                brackets[match.bracket] = brackets.get(match.bracket, 0) + 1
+        self._matches_by_round_bracket = index
+        self._matches_by_player = by_player
+        self._pending = pending
+        self._indexed_match_count = len(self.matches)
+    def matches_in(self, round_num: int, bracket: str) -> List[Match]:
+        """Get the matches of a round in the given bracket"""
+        if self._indexed_match_count != len(self.matches):
+            # Matches were added directly to the dict - resync the index
+            self._rebuild_match_index()
+        return list(self._matches_by_round_bracket.get((round_num, bracket), ()))
+    def player_matches(self, player_id: int) -> List[Match]:
+        """Get every match the player has been paired into"""
+        if self._indexed_match_count != len(self.matches):
+            self._rebuild_match_index()
+        return list(self._matches_by_player.get(player_id, ()))
+    def match_between(self, player1_id: int, player2_id: int,
+                      statuses=_UNFINISHED_STATUSES) -> Optional[Match]:
+        """Find a match between two players whose status is one of the given statuses"""
+        if self._indexed_match_count != len(self.matches):
+            self._rebuild_match_index()
+        player1_matches = self._matches_by_player.get(player1_id)
+        player2_matches = self._matches_by_player.get(player2_id)
+        if not player1_matches or not player2_matches:
+            return None
+        # Only the shorter of the two match lists needs to be walked
+        if len(player2_matches) < len(player1_matches):
+            player1_matches, player2_id = player2_matches, player1_id
+        for match in player1_matches:
+            if match.status in statuses and (match.player1 == player2_id or match.player2 == player2_id):
+                return match
+        return None
+    @property
+    def total_rounds(self) -> int:
+        """Number of elimination rounds for the field, fixed once the tournament starts"""
+        if self._total_rounds is None:
+            player_count = len(self.participants)
+            rounds = (player_count - 1).bit_length() if player_count > 1 else 0
+            if not self.is_started:
+                return rounds
+            self._total_rounds = rounds
+        return self._total_rounds
+    def get_standings(self, limit: Optional[int] = None) -> List[Tuple[int, Participant]]:
+        """Get (user_id, participant) pairs ordered by match points and tiebreakers"""
+        if self._standings_dirty or len(self._standings_cache) != len(self.participants):
+            # Participants added to the dict directly still report their stat changes from here on
+            for participant in self.participants.values():
+                participant._standings_owner = self
+            if limit is not None:
+                # Only the top of the table is needed - skip the full sort
+                top = heapq.nlargest(limit, self.participants.values(), key=_standings_key)
+                return [(participant.user_id, participant) for participant in top]
+            ranked = sorted(self.participants.values(), key=_standings_key, reverse=True)
+            self._standings_cache = [(participant.user_id, participant) for participant in ranked]
+            self._standings_dirty = False
+        if limit is None:
+            return list(self._standings_cache)
+        return self._standings_cache[:limit]
     def get_current_round_matches(self) -> List[Match]:
         """Get matches for the current round"""
         return [m for m in self.matches.values() if m.round_num == self.current_round]
+    def take_seed(self) -> int:
+        """Hand out the next registration seed; seeds are never reused"""
+        seed = self.meta.get("next_seed")
+        if seed is None:
+            # Backups from before seeds were counted - continue after the highest seed given out
+            seed = max((p.seed for p in self.participants.values()), default=0) + 1
+        self.meta["next_seed"] = seed + 1
+        return seed
+    def set_match_status(self, match: Match, status: str):
+        """Change a match's status, counting it out of (or back into) its round's pending matches"""
+        was_unfinished = match.status in _UNFINISHED_STATUSES
+        match.status = status
+        if status in _UNFINISHED_STATUSES:
+            if not was_unfinished:
+                self._track_pending(match)
+        elif was_unfinished:
+            self._untrack_pending(match)
+    def _track_pending(self, match: Match):
+        """Count an unfinished match as pending for its round and bracket"""
+        brackets = self._pending.setdefault(match.round_num, {})
+        brackets[match.bracket] = brackets.get(match.bracket, 0) + 1
+    def _untrack_pending(self, match: Match):
+        """Stop counting a match as pending for its round and bracket"""
+        brackets = self._pending.get(match.round_num)
+        if brackets and brackets.get(match.bracket, 0) > 0:
+            brackets[match.bracket] -= 1
+    def pending_match_count(self, round_num: int, bracket: Optional[str] = None) -> int:
+        """Get the number of unfinished matches in a round, in one bracket or across all of them"""
+        if self._indexed_match_count != len(self.matches):
+            # Matches were added directly to the dict - recount from their statuses
+            self._rebuild_match_index()
+        brackets = self._pending.get(round_num)
+        if not brackets:
+            return 0
+        if bracket is not None:
+            return brackets.get(bracket, 0)
+        return sum(brackets.values())
     def calculate_tournament_duration(self) -> str:
         """Calculate the duration of the tournament"""
         if not self.meta.get("start_time") or not self.meta.get("end_time"):
@@ -34,7 +34,7 @@ class BaseTournamentFormat(ABC):
         Returns result info including if the round is complete
         """
         match = tournament.matches[match_id]
-        match.status = "completed"
+        tournament.set_match_status(match, "completed")
         match.winner = winner_id
         match.loser = loser_id
         match.score = score
@@ -43,11 +43,9 @@ class BaseTournamentFormat(ABC):
         tournament.participants[winner_id].wins += 1
         tournament.participants[loser_id].losses += 1
         tournament.participants[winner_id].match_points += 3
-        current_matches = [m for m in tournament.matches.values() 
-                          if m.round_num == tournament.current_round]
-        round_complete = all(m.status != "pending" and m.status != "awaiting_confirmation" 
-                           for m in current_matches)
-        self.backup.save_tournament_state(
+        round_complete = tournament.pending_match_count(tournament.current_round) == 0
+        tournament.mark_changed()
+        await self.backup.save_tournament_state_async(
             tournament.meta["guild_id"],
             tournament.to_dict()
         )
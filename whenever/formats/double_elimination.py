@@ -7,7 +7,7 @@ import random
 
 from ..core.base import BaseTournamentFormat
 from ..core.models import Tournament, Match, Participant
-from ..utils.constants import MatchStatus, ROUND_MESSAGES
+from ..utils.constants import MatchStatus, ROUND_MESSAGES, get_round_message
 
 class DoubleEliminationTournament(BaseTournamentFormat):
     """
@@ -43,6 +43,7 @@ class DoubleEliminationTournament(BaseTournamentFormat):
         return True
     async def _generate_initial_pairings(self, tournament: Tournament, bracket: str):
         """Generate initial tournament pairings"""
+        now_iso = datetime.now().isoformat()
         player_ids = list(tournament.participants.keys())
         if tournament.config["seeding_enabled"]:
             player_ids.sort(key=lambda p_id: tournament.participants[p_id].seed)
@@ -62,9 +63,9 @@ class DoubleEliminationTournament(BaseTournamentFormat):
                     round_num=tournament.current_round,
                     bracket=bracket,
                     status=MatchStatus.PENDING,
-                    scheduled_time=datetime.now().isoformat()
+                    scheduled_time=now_iso
                 )
-                tournament.matches[match_id] = new_match
+                tournament.add_match(new_match)
                 match_id += 1
             else:
                 # Odd number of players - this player gets a bye
@@ -72,26 +73,21 @@ class DoubleEliminationTournament(BaseTournamentFormat):
                 tournament.participants[bye_player_id].wins += 1
                 
                 # Log bye match
-                self.logger.log_tournament_event(tournament.meta["guild_id"], "bye_granted", {
-                    "player_id": bye_player_id,
-                    "round": tournament.current_round,
-                    "bracket": bracket
-                })
+                self.logger.log_bye_granted(
+                    tournament.meta["guild_id"], bye_player_id, tournament.current_round, bracket
+                )
         tournament.meta["current_match_id"] = match_id
     async def check_round_completion(self, ctx, tournament: Tournament):
         """Check if the current round is complete and start the next round if needed"""
-        winners_matches = [m for m in tournament.matches.values() 
-                          if m.round_num == tournament.current_round and m.bracket == "winners"]
-        losers_matches = [m for m in tournament.matches.values() 
-                         if m.round_num == tournament.current_round and m.bracket == "losers"]
+        winners_matches = tournament.matches_in(tournament.current_round, "winners")
+        losers_matches = tournament.matches_in(tournament.current_round, "losers")
         winners_complete = all(m.status in [MatchStatus.COMPLETED, MatchStatus.DRAW, MatchStatus.DQ] 
                             for m in winners_matches)
         losers_complete = all(m.status in [MatchStatus.COMPLETED, MatchStatus.DRAW, MatchStatus.DQ] 
                            for m in losers_matches)
         if not (winners_complete and losers_complete):
             return
-        finals_matches = [m for m in tournament.matches.values() 
-                         if m.bracket == "finals" and m.round_num == tournament.current_round]
+        finals_matches = tournament.matches_in(tournament.current_round, "finals")
         if finals_matches and all(m.status == MatchStatus.COMPLETED for m in finals_matches):
             champion_id = finals_matches[0].winner
             await self._handle_tournament_completion(ctx, tournament, champion_id)
@@ -99,12 +95,11 @@ class DoubleEliminationTournament(BaseTournamentFormat):
         await self._advance_to_next_round(ctx, tournament)
     async def _advance_to_next_round(self, ctx, tournament: Tournament):
         """Advance to the next round of the tournament"""
-        winners_matches = [m for m in tournament.matches.values() 
-                          if m.round_num == tournament.current_round and m.bracket == "winners"]
+        now_iso = datetime.now().isoformat()
+        winners_matches = tournament.matches_in(tournament.current_round, "winners")
         winners_winners = [m.winner for m in winners_matches if m.winner is not None]
         winners_losers = [m.loser for m in winners_matches if m.loser is not None]
-        losers_matches = [m for m in tournament.matches.values() 
-                         if m.round_num == tournament.current_round and m.bracket == "losers"]
+        losers_matches = tournament.matches_in(tournament.current_round, "losers")
         losers_winners = [m.winner for m in losers_matches if m.winner is not None]
         match_id = tournament.meta["current_match_id"]
         if len(winners_winners) == 1 and len(losers_winners) == 1:
@@ -115,13 +110,14 @@ class DoubleEliminationTournament(BaseTournamentFormat):
                 round_num=tournament.current_round + 1,
                 bracket="finals",
                 status=MatchStatus.PENDING,
-                scheduled_time=datetime.now().isoformat()
+                scheduled_time=now_iso
             )
-            tournament.matches[match_id] = grand_finals
+            tournament.add_match(grand_finals)
             match_id += 1
             tournament.current_round += 1
             tournament.meta["current_match_id"] = match_id
-            self.backup.save_tournament_state(
+            tournament.mark_changed()
+            await self.backup.save_tournament_state_async(
                 tournament.meta["guild_id"], 
                 tournament.to_dict()
             )
@@ -146,9 +142,9 @@ class DoubleEliminationTournament(BaseTournamentFormat):
                         round_num=tournament.current_round + 1,
                         bracket="winners",
                         status=MatchStatus.PENDING,
-                        scheduled_time=datetime.now().isoformat()
+                        scheduled_time=now_iso
                     )
-                    tournament.matches[match_id] = new_match
+                    tournament.add_match(new_match)
                     match_id += 1
         if winners_losers:
             losers_next = winners_losers + losers_winners
@@ -161,19 +157,24 @@ class DoubleEliminationTournament(BaseTournamentFormat):
                         round_num=tournament.current_round + 1,
                         bracket="losers",
                         status=MatchStatus.PENDING,
-                        scheduled_time=datetime.now().isoformat()
+                        scheduled_time=now_iso
                     )
-                    tournament.matches[match_id] = new_match
+                    tournament.add_match(new_match)
                     match_id += 1
         tournament.current_round += 1
         tournament.meta["current_match_id"] = match_id
-        self.backup.save_tournament_state(
+        tournament.mark_changed()
+        await self.backup.save_tournament_state_async(
             tournament.meta["guild_id"], 
             tournament.to_dict()
         )
         embed = discord.Embed(
             title=f"Round {tournament.current_round - 1} Complete!",
-            description=ROUND_MESSAGES["COMPLETE"](tournament.current_round - 1),
+            description=get_round_message(
+                "COMPLETE",
+                round_num=tournament.current_round - 1,
+                next_round=tournament.current_round
+            ),
             color=discord.Color.green()
         )
         
@@ -195,7 +196,8 @@ class DoubleEliminationTournament(BaseTournamentFormat):
         tournament.meta["current_phase"] = "complete"
         
         # Save final state
-        self.backup.save_tournament_state(
+        tournament.mark_changed()
+        await self.backup.save_tournament_state_async(
             tournament.meta["guild_id"], 
             tournament.to_dict()
         )
@@ -265,16 +267,13 @@ class DoubleEliminationTournament(BaseTournamentFormat):
         )
         
         # Get winners bracket matches for current round
-        winners_matches = [m for m in tournament.matches.values() 
-                          if m.round_num == tournament.current_round and m.bracket == "winners"]
+        winners_matches = tournament.matches_in(tournament.current_round, "winners")
         
         # Get losers bracket matches for current round
-        losers_matches = [m for m in tournament.matches.values() 
-                         if m.round_num == tournament.current_round and m.bracket == "losers"]
+        losers_matches = tournament.matches_in(tournament.current_round, "losers")
         
         # Get finals matches for current round
-        finals_matches = [m for m in tournament.matches.values() 
-                         if m.round_num == tournament.current_round and m.bracket == "finals"]
+        finals_matches = tournament.matches_in(tournament.current_round, "finals")
         
         # Add winners bracket section
         if winners_matches:
@@ -294,14 +293,9 @@ class DoubleEliminationTournament(BaseTournamentFormat):
                     status = "⛔ Disqualification"
                 
                 # Check if match is scheduled
-                if match.status == MatchStatus.PENDING and match.scheduled_time:
-                    try:
-                        scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                        timestamp = int(scheduled_time.timestamp())
-                        schedule_info = f" | ⏰ <t:{timestamp}:R>"
-                        status += schedule_info
-                    except:
-                        pass
+                marker = match.schedule_marker("R")
+                if match.status == MatchStatus.PENDING and marker is not None:
+                    status += f" | ⏰ {marker}"
                 
                 winners_content += f"Match {match.match_id}: {player1.display_name} vs {player2.display_name} - {status}\n"
             
@@ -329,14 +323,9 @@ class DoubleEliminationTournament(BaseTournamentFormat):
                     status = "⛔ Disqualification"
                 
                 # Check if match is scheduled
-                if match.status == MatchStatus.PENDING and match.scheduled_time:
-                    try:
-                        scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                        timestamp = int(scheduled_time.timestamp())
-                        schedule_info = f" | ⏰ <t:{timestamp}:R>"
-                        status += schedule_info
-                    except:
-                        pass
+                marker = match.schedule_marker("R")
+                if match.status == MatchStatus.PENDING and marker is not None:
+                    status += f" | ⏰ {marker}"
                 
                 losers_content += f"Match {match.match_id}: {player1.display_name} vs {player2.display_name} - {status}\n"
             
@@ -364,14 +353,9 @@ class DoubleEliminationTournament(BaseTournamentFormat):
                     status = "⛔ Disqualification"
                 
                 # Check if match is scheduled
-                if match.status == MatchStatus.PENDING and match.scheduled_time:
-                    try:
-                        scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                        timestamp = int(scheduled_time.timestamp())
-                        schedule_info = f" | ⏰ <t:{timestamp}:R>"
-                        status += schedule_info
-                    except:
-                        pass
+                marker = match.schedule_marker("R")
+                if match.status == MatchStatus.PENDING and marker is not None:
+                    status += f" | ⏰ {marker}"
                 
                 finals_content += f"Match {match.match_id}: {player1.display_name} vs {player2.display_name} - {status}\n"
             
@@ -382,7 +366,7 @@ class DoubleEliminationTournament(BaseTournamentFormat):
             )
         
         # Add progress information
-        estimated_rounds = self._calculate_total_rounds(len(tournament.participants)) * 2 - 1  # Approximate for DE
+        estimated_rounds = tournament.total_rounds * 2 - 1  # Approximate for DE
         embed.set_footer(text=f"Round {tournament.current_round} | Participants: {len(tournament.participants)}")
         
         return embed
@@ -391,4 +375,5 @@ class DoubleEliminationTournament(BaseTournamentFormat):
         """Calculate the total number of rounds needed for a bracket"""
         if player_count <= 1:
             return 0
-        return math.ceil(math.log2(player_count))
+        # (n - 1).bit_length() == ceil(log2(n)) for n >= 2, without float rounding
+        return (player_count - 1).bit_length()
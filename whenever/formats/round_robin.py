@@ -1,6 +1,7 @@
 import discord
 from discord.ext import commands
 import math
+from collections import defaultdict
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 import random
@@ -59,6 +60,7 @@ class RoundRobinTournament(BaseTournamentFormat):
         
     async def _generate_round_robin_pairings(self, tournament: Tournament):
         """Generate pairings for all rounds of a round robin tournament"""
+        now_iso = datetime.now().isoformat()
         player_ids = list(tournament.participants.keys())
         
         # If odd number of players, add a "dummy" player for byes
@@ -93,9 +95,9 @@ class RoundRobinTournament(BaseTournamentFormat):
                     round_num=round_num,
                     bracket="round_robin",
                     status=MatchStatus.PENDING,
-                    scheduled_time=datetime.now().isoformat()
+                    scheduled_time=now_iso
                 )
-                tournament.matches[match_id] = new_match
+                tournament.add_match(new_match)
                 match_id += 1
             
             # Check for byes
@@ -107,10 +109,7 @@ class RoundRobinTournament(BaseTournamentFormat):
                     tournament.participants[bye_player_id].match_points += 3
                     
                     # Log bye match
-                    self.logger.log_tournament_event(tournament.meta["guild_id"], "bye_granted", {
-                        "player_id": bye_player_id,
-                        "round": round_num
-                    })
+                    self.logger.log_bye_granted(tournament.meta["guild_id"], bye_player_id, round_num)
                 elif players[i] is None and players[n - 1 - i] is not None:
                     # This player gets a bye
                     bye_player_id = players[n - 1 - i]
@@ -118,10 +117,7 @@ class RoundRobinTournament(BaseTournamentFormat):
                     tournament.participants[bye_player_id].match_points += 3
                     
                     # Log bye match
-                    self.logger.log_tournament_event(tournament.meta["guild_id"], "bye_granted", {
-                        "player_id": bye_player_id,
-                        "round": round_num
-                    })
+                    self.logger.log_bye_granted(tournament.meta["guild_id"], bye_player_id, round_num)
             
             # Rotate the players (keep first player fixed)
             players = [players[0]] + [players[-1]] + players[1:-1]
@@ -131,12 +127,8 @@ class RoundRobinTournament(BaseTournamentFormat):
         
     async def check_round_completion(self, ctx, tournament: Tournament):
         """Check if the current round is complete and start the next round if needed"""
-        # Get current round matches
-        current_matches = [m for m in tournament.matches.values() 
-                          if m.round_num == tournament.current_round and m.bracket == "round_robin"]
-        
-        # Check if all matches in the current round are completed
-        if not all(m.status in [MatchStatus.COMPLETED, MatchStatus.DRAW, MatchStatus.DQ] for m in current_matches):
+        # Unfinished matches are counted per round and bracket, so most reports stop here
+        if tournament.pending_match_count(tournament.current_round, "round_robin"):
             return
         
         # Get total rounds
@@ -152,7 +144,8 @@ class RoundRobinTournament(BaseTournamentFormat):
             tournament.current_round += 1
             
             # Save state
-            self.backup.save_tournament_state(
+            tournament.mark_changed()
+            await self.backup.save_tournament_state_async(
                 tournament.meta["guild_id"], 
                 tournament.to_dict()
             )
@@ -175,11 +168,7 @@ class RoundRobinTournament(BaseTournamentFormat):
         is_interaction = hasattr(ctx, 'response')
         
         # Sort players by match points and tiebreakers
-        sorted_players = sorted(
-            tournament.participants.items(),
-            key=lambda x: (x[1].match_points, x[1].tiebreaker_points),
-            reverse=True
-        )
+        sorted_players = tournament.get_standings(limit=10)
         
         # Winner is the player with the most points
         winner_id, winner_info = sorted_players[0]
@@ -195,7 +184,7 @@ class RoundRobinTournament(BaseTournamentFormat):
         )
         
         # Add top players to the embed
-        for i, (player_id, player_info) in enumerate(sorted_players[:10], 1):
+        for i, (player_id, player_info) in enumerate(sorted_players, 1):
             player = await self.bot.fetch_user(player_id)
             winner_mark = "🏆" if i == 1 else ""
             embed.add_field(
@@ -223,7 +212,8 @@ class RoundRobinTournament(BaseTournamentFormat):
         tournament.meta["current_phase"] = "complete"
         
         # Save final state
-        self.backup.save_tournament_state(
+        tournament.mark_changed()
+        await self.backup.save_tournament_state_async(
             tournament.meta["guild_id"], 
             tournament.to_dict()
         )
@@ -286,8 +276,7 @@ class RoundRobinTournament(BaseTournamentFormat):
     async def create_bracket_visualization(self, ctx, tournament: Tournament) -> discord.Embed:
         """Create a visualization of the round robin tournament"""
         # Get current round matches
-        current_matches = [m for m in tournament.matches.values() 
-                           if m.round_num == tournament.current_round and m.bracket == "round_robin"]
+        current_matches = tournament.matches_in(tournament.current_round, "round_robin")
         
         # Get total rounds
         player_count = len(tournament.participants)
@@ -320,14 +309,9 @@ class RoundRobinTournament(BaseTournamentFormat):
                     status = "⛔ Disqualification"
                 
                 # Check if match is scheduled
-                if match.status == MatchStatus.PENDING and match.scheduled_time:
-                    try:
-                        scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                        timestamp = int(scheduled_time.timestamp())
-                        schedule_info = f"\n⏰ Scheduled: <t:{timestamp}:F>"
-                        status += schedule_info
-                    except:
-                        pass
+                marker = match.schedule_marker("F")
+                if match.status == MatchStatus.PENDING and marker is not None:
+                    status += f"\n⏰ Scheduled: {marker}"
                 
                 embed.add_field(
                     name=f"Match {match.match_id}",
@@ -342,17 +326,12 @@ class RoundRobinTournament(BaseTournamentFormat):
             )
         
         # Add standings table
-        sorted_players = sorted(
-            tournament.participants.items(),
-            key=lambda x: (x[1].match_points, x[1].tiebreaker_points),
-            reverse=True
-        )
+        sorted_players = tournament.get_standings(limit=10)
         
         standings = "Current Standings:\n"
-        for i, (player_id, player_info) in enumerate(sorted_players[:10], 1):
+        for i, (player_id, player_info) in enumerate(sorted_players, 1):
             player = await self.bot.fetch_user(player_id)
-            standings += f"{i}. {player.display_name} - {player_info.match_points} pts " \
-                         f"({player_info.wins}-{player_info.losses}-{player_info.draws})\n"
+            standings += f"{i}. {player.display_name} - {player_info.standings_line}\n"
         
         embed.add_field(
             name="Standings",
@@ -383,14 +362,19 @@ class RoundRobinTournament(BaseTournamentFormat):
                 player_matchups[match.player1][match.player2] = 1 if match.winner == match.player1 else 0
                 player_matchups[match.player2][match.player1] = 1 if match.winner == match.player2 else 0
         
+        # Group players by match points once, so finding a player's ties isn't a full scan
+        players_by_points = defaultdict(list)
+        for player_id, player in tournament.participants.items():
+            players_by_points[player.match_points].append(player_id)
+        
         # Calculate tiebreaker points based on head-to-head
         for player_id, player in tournament.participants.items():
             if not player.active:
                 continue
                 
             # Get players with same match points
-            same_points_players = [p_id for p_id, p in tournament.participants.items() 
-                                 if p.match_points == player.match_points and p_id != player_id]
+            same_points_players = [p_id for p_id in players_by_points[player.match_points]
+                                   if p_id != player_id]
             
             # Calculate head-to-head win percentage against tied players
             if same_points_players:
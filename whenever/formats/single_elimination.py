@@ -7,7 +7,7 @@ import random
 
 from .base import BaseTournamentFormat
 from ..core.models import Tournament, Match, Participant
-from ..utils.constants import MatchStatus, ROUND_MESSAGES
+from ..utils.constants import MatchStatus, ROUND_MESSAGES, get_round_message
 
 class SingleEliminationTournament(BaseTournamentFormat):
     """
@@ -43,6 +43,7 @@ class SingleEliminationTournament(BaseTournamentFormat):
         return True
     async def _generate_initial_pairings(self, tournament: Tournament):
         """Generate initial tournament pairings"""
+        now_iso = datetime.now().isoformat()
         player_ids = list(tournament.participants.keys())
         if tournament.config["seeding_enabled"]:
             player_ids.sort(key=lambda p_id: tournament.participants[p_id].seed)
@@ -62,9 +63,9 @@ class SingleEliminationTournament(BaseTournamentFormat):
                     round_num=tournament.current_round,
                     bracket="winners",
                     status=MatchStatus.PENDING,
-                    scheduled_time=datetime.now().isoformat()
+                    scheduled_time=now_iso
                 )
-                tournament.matches[match_id] = new_match
+                tournament.add_match(new_match)
                 match_id += 1
             else:
                 # Odd number of players - this player gets a bye
@@ -72,18 +73,13 @@ class SingleEliminationTournament(BaseTournamentFormat):
                 tournament.participants[bye_player_id].wins += 1
                 
                 # Log bye match
-                self.logger.log_tournament_event(tournament.meta["guild_id"], "bye_granted", {
-                    "player_id": bye_player_id,
-                    "round": tournament.current_round
-                })
+                self.logger.log_bye_granted(tournament.meta["guild_id"], bye_player_id, tournament.current_round)
         tournament.meta["current_match_id"] = match_id
     async def check_round_completion(self, ctx, tournament: Tournament):
         """Check if the current round is complete and start the next round if needed"""
-        current_matches = [m for m in tournament.matches.values() 
-                         if m.round_num == tournament.current_round and m.bracket == "winners"]
-        if not all(m.status in [MatchStatus.COMPLETED, MatchStatus.DRAW, MatchStatus.DQ] 
-                 for m in current_matches):
+        if tournament.pending_match_count(tournament.current_round, "winners"):
             return
+        current_matches = tournament.matches_in(tournament.current_round, "winners")
         winners = [m.winner for m in current_matches if m.winner is not None]
         if len(winners) >= 2:
             await self._advance_to_next_round(ctx, tournament, winners)
@@ -91,6 +87,7 @@ class SingleEliminationTournament(BaseTournamentFormat):
             await self._handle_tournament_completion(ctx, tournament, winners[0])
     async def _advance_to_next_round(self, ctx, tournament: Tournament, winners: List[int]):
         """Advance to the next round of the tournament"""
+        now_iso = datetime.now().isoformat()
         tournament.current_round += 1
         match_id = tournament.meta["current_match_id"]
         for i in range(0, len(winners), 2):
@@ -102,18 +99,23 @@ class SingleEliminationTournament(BaseTournamentFormat):
                     round_num=tournament.current_round,
                     bracket="winners",
                     status=MatchStatus.PENDING,
-                    scheduled_time=datetime.now().isoformat()
+                    scheduled_time=now_iso
                 )
-                tournament.matches[match_id] = new_match
+                tournament.add_match(new_match)
                 match_id += 1
         tournament.meta["current_match_id"] = match_id
-        self.backup.save_tournament_state(
+        tournament.mark_changed()
+        await self.backup.save_tournament_state_async(
             tournament.meta["guild_id"],
             tournament.to_dict()
         )
         embed = discord.Embed(
             title=f"Round {tournament.current_round - 1} Complete!",
-            description=ROUND_MESSAGES["COMPLETE"](tournament.current_round - 1),
+            description=get_round_message(
+                "COMPLETE",
+                round_num=tournament.current_round - 1,
+                next_round=tournament.current_round
+            ),
             color=discord.Color.green()
         )
         is_interaction = hasattr(ctx, 'response')
@@ -128,7 +130,8 @@ class SingleEliminationTournament(BaseTournamentFormat):
         tournament.is_started = False
         tournament.meta["end_time"] = datetime.now().isoformat()
         tournament.meta["current_phase"] = "complete"
-        self.backup.save_tournament_state(
+        tournament.mark_changed()
+        await self.backup.save_tournament_state_async(
             tournament.meta["guild_id"],
             tournament.to_dict()
         )
@@ -174,8 +177,7 @@ class SingleEliminationTournament(BaseTournamentFormat):
         return embed
     async def create_bracket_visualization(self, ctx, tournament: Tournament) -> discord.Embed:
         """Create a visualization of the single elimination bracket"""
-        current_matches = [m for m in tournament.matches.values() 
-                         if m.round_num == tournament.current_round and m.bracket == "winners"]
+        current_matches = tournament.matches_in(tournament.current_round, "winners")
         embed = discord.Embed(
             title=f"Single Elimination - Round {tournament.current_round}",
             description=f"Tournament: {tournament.name}",
@@ -194,20 +196,15 @@ class SingleEliminationTournament(BaseTournamentFormat):
                 status = f"🟠 Draw - {match.score}"
             elif match.status == MatchStatus.DQ:
                 status = "⛔ Disqualification"
-            if match.status == MatchStatus.PENDING and match.scheduled_time:
-                try:
-                    scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                    timestamp = int(scheduled_time.timestamp())
-                    schedule_info = f"\n⏰ Scheduled: <t:{timestamp}:F>"
-                    status += schedule_info
-                except:
-                    pass
+            marker = match.schedule_marker("F")
+            if match.status == MatchStatus.PENDING and marker is not None:
+                status += f"\n⏰ Scheduled: {marker}"
             embed.add_field(
                 name=f"Match {match.match_id}",
                 value=f"{player1.mention} vs {player2.mention}\n{status}",
                 inline=False
             )
-        total_rounds = self._calculate_total_rounds(len(tournament.participants))
+        total_rounds = tournament.total_rounds
         embed.set_footer(text=f"Round {tournament.current_round} of {total_rounds} | "
                              f"Participants: {len(tournament.participants)}")
         return embed
@@ -215,4 +212,5 @@ class SingleEliminationTournament(BaseTournamentFormat):
         """Calculate the total number of rounds needed for a bracket"""
         if player_count <= 1:
             return 0
-        return math.ceil(math.log2(player_count))
+        # (n - 1).bit_length() == ceil(log2(n)) for n >= 2, without float rounding
+        return (player_count - 1).bit_length()
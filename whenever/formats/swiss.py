@@ -7,7 +7,7 @@ import random
 
 from ..core.base import BaseTournamentFormat
 from ..core.models import Tournament, Match, Participant
-from ..utils.constants import MatchStatus, ROUND_MESSAGES
+from ..utils.constants import MatchStatus, get_round_message
 
 class SwissTournament(BaseTournamentFormat):
     """
@@ -18,6 +18,7 @@ class SwissTournament(BaseTournamentFormat):
         self.format_name = "Swiss"
     async def start_tournament(self, ctx, tournament: Tournament) -> bool:
         """Start the Swiss tournament"""
+        rounds_swiss = tournament.config["rounds_swiss"]
         tournament.meta["current_phase"] = "swiss"
         await self._generate_initial_pairings(tournament)
         embed = discord.Embed(
@@ -27,26 +28,21 @@ class SwissTournament(BaseTournamentFormat):
         )
         embed.add_field(
             name="Format", 
-            value=f"{self.format_name} - {tournament.config['rounds_swiss']} Rounds", 
+            value=f"{self.format_name} - {rounds_swiss} Rounds", 
             inline=True
         )
         embed.add_field(
             name="Current Round", 
-            value=f"Round {tournament.current_round} of {tournament.config['rounds_swiss']}", 
+            value=f"Round {tournament.current_round} of {rounds_swiss}", 
             inline=True
         )
-        # Handle different types of context objects
-        is_interaction = hasattr(ctx, 'response')
-        if is_interaction:
-            await ctx.response.send_message(embed=embed)
-        else:
-            await ctx.send(embed=embed)
-            
+        await self._send(ctx, embed=embed)
         return True
         
     async def _generate_initial_pairings(self, tournament: Tournament):
         """Generate initial tournament pairings for first Swiss round"""
         # Sort participants list by seed if seeding is enabled, otherwise random
+        now_iso = datetime.now().isoformat()
         player_ids = list(tournament.participants.keys())
         if tournament.config["seeding_enabled"]:
             player_ids.sort(key=lambda p_id: tournament.participants[p_id].seed)
@@ -54,34 +50,31 @@ class SwissTournament(BaseTournamentFormat):
             # Random initial pairings
             random.shuffle(player_ids)
         
-        # Create pairings
+        # Create pairings - adjacent players are paired, an odd player out gets a bye
         match_id = tournament.meta["current_match_id"]
+        pairs = zip(player_ids[0::2], player_ids[1::2])
+        bye_player_id = player_ids[-1] if len(player_ids) % 2 else None
+        
+        for p1, p2 in pairs:
+            new_match = Match(
+                match_id=match_id,
+                player1=p1,
+                player2=p2,
+                round_num=tournament.current_round,
+                bracket="swiss",
+                status=MatchStatus.PENDING,
+                scheduled_time=now_iso
+            )
+            tournament.add_match(new_match)
+            match_id += 1
         
-        for i in range(0, len(player_ids), 2):
-            if i + 1 < len(player_ids):
-                # Normal pairing
-                new_match = Match(
-                    match_id=match_id,
-                    player1=player_ids[i],
-                    player2=player_ids[i + 1],
-                    round_num=tournament.current_round,
-                    bracket="swiss",
-                    status=MatchStatus.PENDING,
-                    scheduled_time=datetime.now().isoformat()
-                )
-                tournament.matches[match_id] = new_match
-                match_id += 1
-            else:
-                # Odd number of players - this player gets a bye
-                bye_player_id = player_ids[i]
-                tournament.participants[bye_player_id].wins += 1
-                tournament.participants[bye_player_id].match_points += 3  # Award points for bye
-                
-                # Log bye match
-                self.logger.log_tournament_event(tournament.meta["guild_id"], "bye_granted", {
-                    "player_id": bye_player_id,
-                    "round": tournament.current_round
-                })
+        if bye_player_id is not None:
+            # Odd number of players - this player gets a bye
+            tournament.participants[bye_player_id].wins += 1
+            tournament.participants[bye_player_id].match_points += 3  # Award points for bye
+            
+            # Log bye match
+            self.logger.log_bye_granted(tournament.meta["guild_id"], bye_player_id, tournament.current_round)
         
         # Update the match ID counter
         tournament.meta["current_match_id"] = match_id
@@ -89,6 +82,7 @@ class SwissTournament(BaseTournamentFormat):
     async def _generate_swiss_pairings(self, tournament: Tournament):
         """Generate pairings for a Swiss round after the first round"""
         # Group players by their match points
+        now_iso = datetime.now().isoformat()
         point_groups = {}
         active_players = [p_id for p_id, p in tournament.participants.items() if p.active]
         
@@ -142,9 +136,9 @@ class SwissTournament(BaseTournamentFormat):
                     round_num=tournament.current_round,
                     bracket="swiss",
                     status=MatchStatus.PENDING,
-                    scheduled_time=datetime.now().isoformat()
+                    scheduled_time=now_iso
                 )
-                tournament.matches[match_id] = new_match
+                tournament.add_match(new_match)
                 match_id += 1
             
             # If we have an odd number of players, keep the unpaired player
@@ -158,10 +152,7 @@ class SwissTournament(BaseTournamentFormat):
             tournament.participants[unpaired_player].wins += 1
             
             # Log bye match
-            self.logger.log_tournament_event(tournament.meta["guild_id"], "bye_granted", {
-                "player_id": unpaired_player,
-                "round": tournament.current_round
-            })
+            self.logger.log_bye_granted(tournament.meta["guild_id"], unpaired_player, tournament.current_round)
         
         # Update the match ID counter
         tournament.meta["current_match_id"] = match_id
@@ -177,16 +168,12 @@ class SwissTournament(BaseTournamentFormat):
         
     async def check_round_completion(self, ctx, tournament: Tournament):
         """Check if the current round is complete and start the next round if needed"""
-        # Get current round matches
-        current_matches = [m for m in tournament.matches.values() 
-                          if m.round_num == tournament.current_round and m.bracket == "swiss"]
-        
-        # Check if all matches in the current round are completed
-        if not all(m.status in [MatchStatus.COMPLETED, MatchStatus.DRAW, MatchStatus.DQ] for m in current_matches):
+        rounds_swiss = tournament.config["rounds_swiss"]
+        if tournament.pending_match_count(tournament.current_round, "swiss"):
             return
         
         # Check if we've reached the maximum number of Swiss rounds
-        if tournament.current_round >= tournament.config["rounds_swiss"]:
+        if tournament.current_round >= rounds_swiss:
             # Swiss rounds are complete, move to elimination bracket with top players
             await self._start_elimination_phase(ctx, tournament)
         else:
@@ -197,7 +184,8 @@ class SwissTournament(BaseTournamentFormat):
             await self._generate_swiss_pairings(tournament)
             
             # Save state
-            self.backup.save_tournament_state(
+            tournament.mark_changed()
+            await self.backup.save_tournament_state_async(
                 tournament.meta["guild_id"], 
                 tournament.to_dict()
             )
@@ -208,23 +196,14 @@ class SwissTournament(BaseTournamentFormat):
                 description=f"Round {tournament.current_round - 1} is complete! Starting Round {tournament.current_round}...",
                 color=discord.Color.green()
             )
-            
-            is_interaction = hasattr(ctx, 'response')
-            if is_interaction:
-                await ctx.followup.send(embed=embed)
-            else:
-                await ctx.send(embed=embed)
+            await self._send(ctx, embed=embed, followup=True)
     
     async def _start_elimination_phase(self, ctx, tournament: Tournament):
         """Start the elimination phase after Swiss rounds"""
-        is_interaction = hasattr(ctx, 'response')
         
         # Get top players based on match points and tiebreakers
-        sorted_players = sorted(
-            tournament.participants.items(),
-            key=lambda x: (x[1].match_points, x[1].tiebreaker_points),
-            reverse=True
-        )
+        now_iso = datetime.now().isoformat()
+        sorted_players = tournament.get_standings()
         
         # Get top X players for the elimination bracket
         top_cut = min(tournament.config["top_cut"], len(sorted_players))
@@ -237,25 +216,25 @@ class SwissTournament(BaseTournamentFormat):
         # Create matches for the elimination bracket
         match_id = tournament.meta["current_match_id"]
         
-        for i in range(0, len(top_players), 2):
-            if i + 1 < len(top_players):
-                new_match = Match(
-                    match_id=match_id,
-                    player1=top_players[i],
-                    player2=top_players[i + 1],
-                    round_num=tournament.current_round,
-                    bracket="elimination",
-                    status=MatchStatus.PENDING,
-                    scheduled_time=datetime.now().isoformat()
-                )
-                tournament.matches[match_id] = new_match
-                match_id += 1
+        for p1, p2 in zip(top_players[0::2], top_players[1::2]):
+            new_match = Match(
+                match_id=match_id,
+                player1=p1,
+                player2=p2,
+                round_num=tournament.current_round,
+                bracket="elimination",
+                status=MatchStatus.PENDING,
+                scheduled_time=now_iso
+            )
+            tournament.add_match(new_match)
+            match_id += 1
         
         # Update match ID counter
         tournament.meta["current_match_id"] = match_id
         
         # Save state
-        self.backup.save_tournament_state(
+        tournament.mark_changed()
+        await self.backup.save_tournament_state_async(
             tournament.meta["guild_id"], 
             tournament.to_dict()
         )
@@ -263,14 +242,10 @@ class SwissTournament(BaseTournamentFormat):
         # Send Swiss complete message
         embed = discord.Embed(
             title="Swiss Rounds Complete",
-            description=f"Swiss rounds complete! Top {top_cut} advancing to elimination bracket.",
+            description=get_round_message("SWISS_COMPLETE", top_cut=top_cut),
             color=discord.Color.blue()
         )
-        
-        if is_interaction:
-            await ctx.followup.send(embed=embed)
-        else:
-            await ctx.send(embed=embed)
+        await self._send(ctx, embed=embed, followup=True)
         
         # Create standings embed
         standings_embed = discord.Embed(
@@ -291,22 +266,20 @@ class SwissTournament(BaseTournamentFormat):
             )
         
         # Send standings
-        if is_interaction:
-            await ctx.followup.send(embed=standings_embed)
-        else:
-            await ctx.send(embed=standings_embed)
+        await self._send(ctx, embed=standings_embed, followup=True)
     
     async def create_bracket_visualization(self, ctx, tournament: Tournament) -> discord.Embed:
         """Create a visualization of the Swiss tournament bracket"""
         # Get current round matches
-        current_matches = [m for m in tournament.matches.values() 
-                           if m.round_num == tournament.current_round and m.bracket == "swiss"]
+        current_matches = tournament.matches_in(tournament.current_round, "swiss")
+        
+        rounds_swiss = tournament.config["rounds_swiss"]
         
         # Create embed
         embed = discord.Embed(
             title=f"Swiss Tournament - Round {tournament.current_round}",
             description=f"Tournament: {tournament.name} | "
-                        f"Round {tournament.current_round} of {tournament.config['rounds_swiss']}",
+                        f"Round {tournament.current_round} of {rounds_swiss}",
             color=discord.Color.green()
         )
         
@@ -316,8 +289,8 @@ class SwissTournament(BaseTournamentFormat):
             player2 = await self.bot.fetch_user(match.player2)
             
             # Get player records
-            p1_record = f"{tournament.participants[player1.id].wins}-{tournament.participants[player1.id].losses}"
-            p2_record = f"{tournament.participants[player2.id].wins}-{tournament.participants[player2.id].losses}"
+            p1_record = tournament.participants[player1.id].record_str
+            p2_record = tournament.participants[player2.id].record_str
             
             # Determine match status
             status = "🟡 In Progress"
@@ -332,14 +305,9 @@ class SwissTournament(BaseTournamentFormat):
                 status = "⛔ Disqualification"
             
             # Check if match is scheduled
-            if match.status == MatchStatus.PENDING and match.scheduled_time:
-                try:
-                    scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                    timestamp = int(scheduled_time.timestamp())
-                    schedule_info = f"\n⏰ Scheduled: <t:{timestamp}:F>"
-                    status += schedule_info
-                except:
-                    pass
+            marker = match.schedule_marker("F")
+            if match.status == MatchStatus.PENDING and marker is not None:
+                status += f"\n⏰ Scheduled: {marker}"
             
             embed.add_field(
                 name=f"Match {match.match_id}",
@@ -348,17 +316,12 @@ class SwissTournament(BaseTournamentFormat):
             )
         
         # Add standings section (top 5 players)
-        sorted_players = sorted(
-            tournament.participants.items(),
-            key=lambda x: (x[1].match_points, x[1].tiebreaker_points),
-            reverse=True
-        )
+        sorted_players = tournament.get_standings(limit=5)
         
         standings = "Current Standings (Top 5):\n"
-        for i, (player_id, player_info) in enumerate(sorted_players[:5], 1):
+        for i, (player_id, player_info) in enumerate(sorted_players, 1):
             player = await self.bot.fetch_user(player_id)
-            standings += f"{i}. {player.display_name} - {player_info.match_points} pts " \
-                         f"({player_info.wins}-{player_info.losses}-{player_info.draws})\n"
+            standings += f"{i}. {player.display_name} - {player_info.standings_line}\n"
         
         embed.add_field(
             name="Standings",
@@ -370,37 +333,32 @@ class SwissTournament(BaseTournamentFormat):
         
     async def _calculate_tiebreakers(self, tournament: Tournament):
         """Calculate tiebreaker points for all players (opponent win percentage)"""
+        # Every player's win percentage, computed once instead of once per opponent faced
+        win_percentages = {}
+        for player_id, player in tournament.participants.items():
+            total_matches = player.wins + player.losses + player.draws
+            win_percentages[player_id] = player.wins / total_matches if total_matches > 0 else 0.0
+        
         for player_id, player in tournament.participants.items():
             if not player.active:
                 continue
                 
             # Get all opponents this player has faced
             opponents = []
-            for match in tournament.matches.values():
+            for match in tournament.player_matches(player_id):
                 if match.status != MatchStatus.COMPLETED and match.status != MatchStatus.DRAW:
                     continue
                     
-                if match.player1 == player_id and match.player2 is not None:
-                    opponents.append(match.player2)
-                elif match.player2 == player_id and match.player1 is not None:
-                    opponents.append(match.player1)
+                opponent = match.player2 if match.player1 == player_id else match.player1
+                if opponent is not None:
+                    opponents.append(opponent)
             
             # Calculate average win percentage of opponents
             if not opponents:
                 player.tiebreaker_points = 0.0
                 continue
                 
-            opponent_win_percentages = []
-            for opp_id in opponents:
-                opp = tournament.participants[opp_id]
-                total_matches = opp.wins + opp.losses + opp.draws
-                
-                if total_matches > 0:
-                    win_pct = opp.wins / total_matches
-                else:
-                    win_pct = 0.0
-                    
-                opponent_win_percentages.append(win_pct)
+            opponent_win_percentages = [win_percentages[opp_id] for opp_id in opponents]
                 
             # Update tiebreaker points (opponent win percentage)
             if opponent_win_percentages:
@@ -1,44 +1,218 @@
 import discord
-from typing import Dict, List, Optional, Any
-import math
+from typing import Dict, List, Optional, Any, Tuple, Iterable
+import asyncio
+import heapq
+from itertools import islice
+from operator import attrgetter
+import time
 from datetime import datetime
 
 from ..core.models import Tournament, Match, Participant
 from ..utils.constants import MatchStatus, TournamentMode
 
 
+USER_CACHE_TTL = 300  # Seconds a fetched user is reused across bracket renders
+MAX_EMBED_FIELDS = 25  # Discord's per-embed field limit
+MAX_FIELD_VALUE_LENGTH = 1024  # Discord's per-field value limit
+EMBED_CACHE_TTL = 60  # Seconds an unchanged bracket embed is reused, so nickname changes still show up
+
+# Display names for stored mode and phase identifiers
+_MODE_DISPLAY = {
+    TournamentMode.SINGLE_ELIMINATION: "Single Elimination",
+    TournamentMode.DOUBLE_ELIMINATION: "Double Elimination",
+    TournamentMode.SWISS: "Swiss",
+    TournamentMode.ROUND_ROBIN: "Round Robin"
+}
+_PHASE_DISPLAY = {
+    "registration": "Registration",
+    "swiss": "Swiss",
+    "elimination": "Elimination",
+    "round_robin": "Round Robin",
+    "complete": "Complete"
+}
+# Status lines for finished or waiting matches that don't name the winner
+_STATUS_TEMPLATES = {
+    MatchStatus.AWAITING_CONFIRMATION: "🟠 Waiting for confirmation - {score}",
+    MatchStatus.DRAW: "🟠 Draw - {score}",
+    MatchStatus.DQ: "⛔ Disqualification"
+}
+
+
+class _UnknownUser:
+    """Stand-in for a user Discord could not return, so embeds can still show them"""
+    __slots__ = ("id", "mention", "display_name")
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.mention = f"<@{user_id}>"
+        self.display_name = f"Unknown user ({user_id})"
+
+
 class BracketService:
     """
     Service for handling tournament bracket visualization
     """
+    # Embed builder method for each tournament mode
+    _FORMAT_HANDLER_NAMES = {
+        TournamentMode.SINGLE_ELIMINATION: "_create_single_elimination_embed",
+        TournamentMode.DOUBLE_ELIMINATION: "_create_double_elimination_embed",
+        TournamentMode.SWISS: "_create_swiss_embed",
+        TournamentMode.ROUND_ROBIN: "_create_round_robin_embed"
+    }
+    
     def __init__(self, bot, logger, backup=None):
         self.bot = bot
         self.logger = logger
-        self.format_handlers = {
-            TournamentMode.SINGLE_ELIMINATION: self._create_single_elimination_embed,
-            TournamentMode.DOUBLE_ELIMINATION: self._create_double_elimination_embed,
-            TournamentMode.SWISS: self._create_swiss_embed,
-            TournamentMode.ROUND_ROBIN: self._create_round_robin_embed
-        }
+        self._user_cache: Dict[int, Tuple[discord.User, float]] = {}
+        self._embed_cache: Dict[Tuple[str, Optional[int]], Tuple[int, float, discord.Embed]] = {}
+    async def _get_user(self, user_id: int, guild: Optional[discord.Guild] = None) -> discord.abc.User:
+        """Get a user from the guild or bot cache, falling back to a cached REST fetch"""
+        if guild is not None:
+            member = guild.get_member(user_id)
+            if member is not None:
+                return member
+        user = self.bot.get_user(user_id)
+        if user is not None:
+            return user
+        cached = self._user_cache.get(user_id)
+        if cached is not None:
+            user, expires = cached
+            if time.monotonic() < expires:
+                return user
+            del self._user_cache[user_id]
+        user = await self.bot.fetch_user(user_id)
+        self._user_cache[user_id] = (user, time.monotonic() + USER_CACHE_TTL)
+        return user
+    
+    async def get_users(
+        self, user_ids: Iterable[int], guild: Optional[discord.Guild] = None
+    ) -> Dict[int, discord.abc.User]:
+        """Fetch several users concurrently, with a placeholder for any Discord could not return"""
+        user_ids = list(dict.fromkeys(user_ids))
+        results = await asyncio.gather(
+            *(self._get_user(user_id, guild) for user_id in user_ids),
+            return_exceptions=True
+        )
+        users = {}
+        for user_id, result in zip(user_ids, results):
+            if isinstance(result, discord.HTTPException):
+                # Deleted or inaccessible account - keep it listed rather than dropping it
+                result = _UnknownUser(user_id)
+            elif isinstance(result, BaseException):
+                raise result
+            users[user_id] = result
+        return users
+    
+    @staticmethod
+    def _match_user_ids(matches: Iterable[Match]):
+        """Yield the IDs of every user shown for the given matches"""
+        for match in matches:
+            yield match.player1
+            yield match.player2
+            if match.status == MatchStatus.COMPLETED:
+                yield match.winner
+    
+    def _format_match_status(self, match: Match, users: Dict[int, discord.User],
+                             compact: bool = False, show_schedule: bool = True) -> str:
+        """Build the status line for a match from prefetched users"""
+        if match.status == MatchStatus.COMPLETED:
+            winner = users[match.winner]
+            if compact:
+                return f"✅ {match.score} - Winner: {winner.display_name}"
+            return f"✅ Complete - {match.score} - Winner: {winner.display_name}"
+        template = _STATUS_TEMPLATES.get(match.status)
+        if template is not None:
+            return template.format(score=match.score)
+        status = "🟡 In Progress"
+        if show_schedule and match.status == MatchStatus.PENDING:
+            # Check if match is scheduled
+            if compact:
+                marker = match.schedule_marker("R")
+                if marker is not None:
+                    status += f" | ⏰ {marker}"
+            else:
+                marker = match.schedule_marker("F")
+                if marker is not None:
+                    status += f"\n⏰ Scheduled: {marker}"
+        return status
+    
+    def _add_match_fields(self, embed: discord.Embed, fields: List[Tuple[str, str]], reserved: int = 0):
+        """Add one field per match, grouping matches when Discord's field limit would be exceeded"""
+        available = MAX_EMBED_FIELDS - len(embed.fields) - reserved
+        if len(fields) <= available:
+            for name, value in fields:
+                embed.add_field(name=name, value=value, inline=False)
+            return
+        # Too many matches for a field each - pack them into as few fields as possible
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        size = 0
+        for name, value in fields:
+            entry = f"**{name}**\n{value}"
+            if current and size + len(entry) + 2 > MAX_FIELD_VALUE_LENGTH:
+                chunks.append(current)
+                current, size = [], 0
+            current.append(entry)
+            size += len(entry) + 2
+        if current:
+            chunks.append(current)
+        hidden = 0
+        if len(chunks) > available:
+            hidden = sum(len(chunk) for chunk in chunks[available - 1:])
+            chunks = chunks[:available - 1]
+        for index, chunk in enumerate(chunks):
+            embed.add_field(
+                name="Matches" if index == 0 else "Matches (cont.)",
+                value="\n\n".join(chunk),
+                inline=False
+            )
+        if hidden:
+            embed.add_field(
+                name="Matches (cont.)",
+                value=f"...and {hidden} more matches",
+                inline=False
+            )
+    
     async def create_bracket_embed(self, ctx, tournament: Tournament) -> discord.Embed:
-        """Create appropriate bracket visualization based on tournament type"""
+        """Create appropriate bracket visualization, reusing the last one if nothing changed"""
+        guild = getattr(ctx, "guild", None)
+        key = (tournament.meta["id"], guild.id if guild is not None else None)
+        cached = self._embed_cache.get(key)
+        if (cached is not None and cached[0] == tournament.render_version
+                and time.monotonic() < cached[1]):
+            return cached[2].copy()
+        
+        version = tournament.render_version
+        embed = await self._build_bracket_embed(tournament, guild)
+        self._embed_cache[key] = (version, time.monotonic() + EMBED_CACHE_TTL, embed)
+        return embed.copy()
+    
+    def forget_tournament(self, tournament: Tournament):
+        """Drop cached embeds of a tournament that is no longer held in memory"""
+        tournament_id = tournament.meta["id"]
+        for key in [key for key in self._embed_cache if key[0] == tournament_id]:
+            del self._embed_cache[key]
+    
+    async def _build_bracket_embed(self, tournament: Tournament, guild: Optional[discord.Guild]) -> discord.Embed:
+        """Build the bracket visualization for the tournament's type and phase"""
         if not tournament.is_started:
-            return await self._create_registration_embed(tournament)
+            return await self._create_registration_embed(tournament, guild)
+        
+        mode = tournament.config["tournament_mode"]
         
         # Check tournament phase
-        if tournament.meta["current_phase"] == "elimination" and tournament.config["tournament_mode"] == TournamentMode.SWISS:
+        if mode == TournamentMode.SWISS and tournament.meta["current_phase"] == "elimination":
             # Top cut phase of a Swiss tournament
-            return await self._create_elimination_embed(tournament)
+            return await self._create_elimination_embed(tournament, guild)
         
         # Use the appropriate handler based on tournament mode
-        handler = self.format_handlers.get(tournament.config["tournament_mode"])
-        if handler:
-            return await handler(tournament)
+        handler_name = self._FORMAT_HANDLER_NAMES.get(mode)
+        if handler_name:
+            return await getattr(self, handler_name)(tournament, guild)
         
         # Fallback to generic bracket
-        return await self._create_generic_bracket_embed(tournament)
+        return await self._create_generic_bracket_embed(tournament, guild)
         
-    async def _create_registration_embed(self, tournament: Tournament) -> discord.Embed:
+    async def _create_registration_embed(self, tournament: Tournament, guild: Optional[discord.Guild] = None) -> discord.Embed:
         """Create an embed showing registration status"""
         embed = discord.Embed(
             title=f"Tournament Registration: {tournament.name}",
@@ -55,7 +229,7 @@ class BracketService:
         
         embed.add_field(
             name="Format",
-            value=tournament.config["tournament_mode"].replace("_", " ").title(),
+            value=_MODE_DISPLAY.get(tournament.config["tournament_mode"], tournament.config["tournament_mode"]),
             inline=True
         )
         
@@ -73,36 +247,29 @@ class BracketService:
         
         if tournament.participants:
             # Add some registered players
-            players_text = ""
-            count = 0
             max_display = 10  # Show at most 10 players
+            shown_ids = list(islice(tournament.participants, max_display))
+            users = await self.get_users(shown_ids, guild=guild)
+            # Users that could not be fetched come back as placeholders, so every shown ID gets a line
+            player_lines = [users[player_id].mention for player_id in shown_ids]
             
-            for player_id in tournament.participants:
-                try:
-                    user = await self.bot.fetch_user(player_id)
-                    players_text += f"{user.mention}\n"
-                    count += 1
-                    if count >= max_display:
-                        if len(tournament.participants) > max_display:
-                            players_text += f"...and {len(tournament.participants) - max_display} more"
-                        break
-                except:
-                    pass
+            remaining = len(tournament.participants) - max_display
+            if remaining > 0:
+                player_lines.append(f"...and {remaining} more")
             
-            if players_text:
-                embed.add_field(
-                    name="Participants",
-                    value=players_text,
-                    inline=False
-                )
+            embed.add_field(
+                name="Participants",
+                value="\n".join(player_lines),
+                inline=False
+            )
         
         return embed
         
-    async def _create_single_elimination_embed(self, tournament: Tournament) -> discord.Embed:
+    async def _create_single_elimination_embed(self, tournament: Tournament, guild: Optional[discord.Guild] = None) -> discord.Embed:
         """Create visualization for single elimination bracket"""
         # Get current round matches
-        current_matches = [m for m in tournament.matches.values() 
-                          if m.round_num == tournament.current_round and m.bracket == "winners"]
+        current_matches = tournament.matches_in(tournament.current_round, "winners")
+        users = await self.get_users(self._match_user_ids(current_matches), guild=guild)
         
         # Create embed
         embed = discord.Embed(
@@ -112,183 +279,79 @@ class BracketService:
         )
         
         # Add current matches to the embed
+        match_fields = []
         for match in current_matches:
-            player1 = await self.bot.fetch_user(match.player1)
-            player2 = await self.bot.fetch_user(match.player2)
-            
-            # Determine match status
-            status = "🟡 In Progress"
-            if match.status == MatchStatus.COMPLETED:
-                winner = await self.bot.fetch_user(match.winner)
-                status = f"✅ Complete - {match.score} - Winner: {winner.display_name}"
-            elif match.status == MatchStatus.AWAITING_CONFIRMATION:
-                status = f"🟠 Waiting for confirmation - {match.score}"
-            elif match.status == MatchStatus.DRAW:
-                status = f"🟠 Draw - {match.score}"
-            elif match.status == MatchStatus.DQ:
-                status = "⛔ Disqualification"
+            player1 = users[match.player1]
+            player2 = users[match.player2]
             
-            # Check if match is scheduled
-            if match.status == MatchStatus.PENDING and match.scheduled_time:
-                try:
-                    scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                    timestamp = int(scheduled_time.timestamp())
-                    schedule_info = f"\n⏰ Scheduled: <t:{timestamp}:F>"
-                    status += schedule_info
-                except:
-                    pass
+            status = self._format_match_status(match, users)
             
-            embed.add_field(
-                name=f"Match {match.match_id}",
-                value=f"{player1.mention} vs {player2.mention}\n{status}",
-                inline=False
-            )
+            match_fields.append((
+                f"Match {match.match_id}",
+                f"{player1.mention} vs {player2.mention}\n{status}"
+            ))
+        self._add_match_fields(embed, match_fields)
         
         # Add progress information
-        total_rounds = self._calculate_total_rounds(len(tournament.participants))
+        total_rounds = tournament.total_rounds
         embed.set_footer(text=f"Round {tournament.current_round} of {total_rounds} | "
                              f"Participants: {len(tournament.participants)}")
         
         return embed
     
-    async def _create_double_elimination_embed(self, tournament: Tournament) -> discord.Embed:
+    async def _create_double_elimination_embed(self, tournament: Tournament, guild: Optional[discord.Guild] = None) -> discord.Embed:
         """Create visualization for double elimination bracket"""
-        # Create parent embed
-        embed = discord.Embed(
-            title=f"Double Elimination - Round {tournament.current_round}",
-            description=f"Tournament: {tournament.name}",
-            color=discord.Color.blue()
+        # Get the current round's winners, losers and finals matches
+        current_round = tournament.current_round
+        winners_matches = tournament.matches_in(current_round, "winners")
+        losers_matches = tournament.matches_in(current_round, "losers")
+        finals_matches = tournament.matches_in(current_round, "finals")
+        
+        # Fetch the players of all three brackets in one batch
+        users = await self.get_users(
+            self._match_user_ids(winners_matches + losers_matches + finals_matches), guild=guild
         )
         
-        # Get winners bracket matches for current round
-        winners_matches = [m for m in tournament.matches.values() 
-                          if m.round_num == tournament.current_round and m.bracket == "winners"]
-        
-        # Get losers bracket matches for current round
-        losers_matches = [m for m in tournament.matches.values() 
-                         if m.round_num == tournament.current_round and m.bracket == "losers"]
-        
-        # Get finals matches for current round
-        finals_matches = [m for m in tournament.matches.values() 
-                         if m.round_num == tournament.current_round and m.bracket == "finals"]
-        
-        # Add winners bracket section
-        if winners_matches:
-            winners_content = ""
-            for match in winners_matches:
-                player1 = await self.bot.fetch_user(match.player1)
-                player2 = await self.bot.fetch_user(match.player2)
-                
-                # Determine match status
-                status = "🟡 In Progress"
-                if match.status == MatchStatus.COMPLETED:
-                    winner = await self.bot.fetch_user(match.winner)
-                    status = f"✅ {match.score} - Winner: {winner.display_name}"
-                elif match.status == MatchStatus.AWAITING_CONFIRMATION:
-                    status = f"🟠 Waiting for confirmation - {match.score}"
-                elif match.status == MatchStatus.DQ:
-                    status = "⛔ Disqualification"
-                
-                # Check if match is scheduled
-                if match.status == MatchStatus.PENDING and match.scheduled_time:
-                    try:
-                        scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                        timestamp = int(scheduled_time.timestamp())
-                        schedule_info = f" | ⏰ <t:{timestamp}:R>"
-                        status += schedule_info
-                    except:
-                        pass
-                
-                winners_content += f"Match {match.match_id}: {player1.display_name} vs {player2.display_name} - {status}\n"
-            
-            embed.add_field(
-                name="🏆 Winners Bracket",
-                value=winners_content,
-                inline=False
-            )
-        
-        # Add losers bracket section
-        if losers_matches:
-            losers_content = ""
-            for match in losers_matches:
-                player1 = await self.bot.fetch_user(match.player1)
-                player2 = await self.bot.fetch_user(match.player2)
-                
-                # Determine match status
-                status = "🟡 In Progress"
-                if match.status == MatchStatus.COMPLETED:
-                    winner = await self.bot.fetch_user(match.winner)
-                    status = f"✅ {match.score} - Winner: {winner.display_name}"
-                elif match.status == MatchStatus.AWAITING_CONFIRMATION:
-                    status = f"🟠 Waiting for confirmation - {match.score}"
-                elif match.status == MatchStatus.DQ:
-                    status = "⛔ Disqualification"
-                
-                # Check if match is scheduled
-                if match.status == MatchStatus.PENDING and match.scheduled_time:
-                    try:
-                        scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                        timestamp = int(scheduled_time.timestamp())
-                        schedule_info = f" | ⏰ <t:{timestamp}:R>"
-                        status += schedule_info
-                    except:
-                        pass
-                
-                losers_content += f"Match {match.match_id}: {player1.display_name} vs {player2.display_name} - {status}\n"
-            
-            embed.add_field(
-                name="🔄 Losers Bracket",
-                value=losers_content,
-                inline=False
-            )
-        
-        # Add finals section
-        if finals_matches:
-            finals_content = ""
-            for match in finals_matches:
-                player1 = await self.bot.fetch_user(match.player1)
-                player2 = await self.bot.fetch_user(match.player2)
-                
-                # Determine match status
-                status = "🟡 In Progress"
-                if match.status == MatchStatus.COMPLETED:
-                    winner = await self.bot.fetch_user(match.winner)
-                    status = f"✅ {match.score} - Winner: {winner.display_name}"
-                elif match.status == MatchStatus.AWAITING_CONFIRMATION:
-                    status = f"🟠 Waiting for confirmation - {match.score}"
-                elif match.status == MatchStatus.DQ:
-                    status = "⛔ Disqualification"
+        # One field per bracket section that has matches this round
+        fields = []
+        for section_name, section_matches in (
+            ("🏆 Winners Bracket", winners_matches),
+            ("🔄 Losers Bracket", losers_matches),
+            ("🏅 Grand Finals", finals_matches)
+        ):
+            if not section_matches:
+                continue
+            lines = []
+            for match in section_matches:
+                player1 = users[match.player1]
+                player2 = users[match.player2]
                 
-                # Check if match is scheduled
-                if match.status == MatchStatus.PENDING and match.scheduled_time:
-                    try:
-                        scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                        timestamp = int(scheduled_time.timestamp())
-                        schedule_info = f" | ⏰ <t:{timestamp}:R>"
-                        status += schedule_info
-                    except:
-                        pass
+                status = self._format_match_status(match, users, compact=True)
                 
-                finals_content += f"Match {match.match_id}: {player1.display_name} vs {player2.display_name} - {status}\n"
+                lines.append(f"Match {match.match_id}: {player1.display_name} vs {player2.display_name} - {status}")
             
-            embed.add_field(
-                name="🏅 Grand Finals",
-                value=finals_content,
-                inline=False
-            )
-        
-        # Add progress information
-        estimated_rounds = self._calculate_total_rounds(len(tournament.participants)) * 2 - 1  # Approximate for DE
-        embed.set_footer(text=f"Round {tournament.current_round} | "
-                             f"Participants: {len(tournament.participants)}")
-        
-        return embed
+            fields.append({"name": section_name, "value": "\n".join(lines), "inline": False})
+        
+        # Build the embed in one pass instead of repeated add_field calls
+        return discord.Embed.from_dict({
+            "title": f"Double Elimination - Round {current_round}",
+            "description": f"Tournament: {tournament.name}",
+            "color": discord.Color.blue().value,
+            "fields": fields,
+            "footer": {"text": f"Round {current_round} | Participants: {len(tournament.participants)}"}
+        })
     
-    async def _create_swiss_embed(self, tournament: Tournament) -> discord.Embed:
+    async def _create_swiss_embed(self, tournament: Tournament, guild: Optional[discord.Guild] = None) -> discord.Embed:
         """Create visualization for Swiss tournament"""
         # Get current round matches
-        current_matches = [m for m in tournament.matches.values() 
-                           if m.round_num == tournament.current_round and m.bracket == "swiss"]
+        current_matches = tournament.matches_in(tournament.current_round, "swiss")
+        
+        # Top 5 players for the standings section
+        sorted_players = tournament.get_standings(limit=5)
+        users = await self.get_users([
+            *self._match_user_ids(current_matches),
+            *(player_id for player_id, _ in sorted_players)
+        ], guild=guild)
         
         # Create embed
         embed = discord.Embed(
@@ -299,68 +362,48 @@ class BracketService:
         )
         
         # Add current matches to the embed
+        match_fields = []
         for match in current_matches:
-            player1 = await self.bot.fetch_user(match.player1)
-            player2 = await self.bot.fetch_user(match.player2)
+            player1 = users[match.player1]
+            player2 = users[match.player2]
             
             # Get player records
-            p1_record = f"{tournament.participants[player1.id].wins}-{tournament.participants[player1.id].losses}"
-            p2_record = f"{tournament.participants[player2.id].wins}-{tournament.participants[player2.id].losses}"
+            p1_record = tournament.participants[match.player1].record_str
+            p2_record = tournament.participants[match.player2].record_str
             
-            # Determine match status
-            status = "🟡 In Progress"
-            if match.status == MatchStatus.COMPLETED:
-                winner = await self.bot.fetch_user(match.winner)
-                status = f"✅ Complete - {match.score} - Winner: {winner.display_name}"
-            elif match.status == MatchStatus.AWAITING_CONFIRMATION:
-                status = f"🟠 Waiting for confirmation - {match.score}"
-            elif match.status == MatchStatus.DRAW:
-                status = f"🟠 Draw - {match.score}"
-            elif match.status == MatchStatus.DQ:
-                status = "⛔ Disqualification"
+            status = self._format_match_status(match, users)
             
-            # Check if match is scheduled
-            if match.status == MatchStatus.PENDING and match.scheduled_time:
-                try:
-                    scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                    timestamp = int(scheduled_time.timestamp())
-                    schedule_info = f"\n⏰ Scheduled: <t:{timestamp}:F>"
-                    status += schedule_info
-                except:
-                    pass
-            
-            embed.add_field(
-                name=f"Match {match.match_id}",
-                value=f"{player1.display_name} ({p1_record}) vs {player2.display_name} ({p2_record})\n{status}",
-                inline=False
-            )
+            match_fields.append((
+                f"Match {match.match_id}",
+                f"{player1.display_name} ({p1_record}) vs {player2.display_name} ({p2_record})\n{status}"
+            ))
+        self._add_match_fields(embed, match_fields, reserved=1)
         
         # Add standings section (top 5 players)
-        sorted_players = sorted(
-            tournament.participants.items(),
-            key=lambda x: (x[1].match_points, x[1].tiebreaker_points),
-            reverse=True
-        )
-        
-        standings = "Current Standings (Top 5):\n"
-        for i, (player_id, player_info) in enumerate(sorted_players[:5], 1):
-            player = await self.bot.fetch_user(player_id)
-            standings += f"{i}. {player.display_name} - {player_info.match_points} pts " \
-                         f"({player_info.wins}-{player_info.losses}-{player_info.draws})\n"
+        standings = ["Current Standings (Top 5):"]
+        for i, (player_id, player_info) in enumerate(sorted_players, 1):
+            player = users[player_id]
+            standings.append(f"{i}. {player.display_name} - {player_info.standings_line}")
         
         embed.add_field(
             name="Standings",
-            value=standings,
+            value="\n".join(standings),
             inline=False
         )
         
         return embed
     
-    async def _create_round_robin_embed(self, tournament: Tournament) -> discord.Embed:
+    async def _create_round_robin_embed(self, tournament: Tournament, guild: Optional[discord.Guild] = None) -> discord.Embed:
         """Create visualization for round robin tournament"""
         # Get current round matches
-        current_matches = [m for m in tournament.matches.values() 
-                           if m.round_num == tournament.current_round and m.bracket == "round_robin"]
+        current_matches = tournament.matches_in(tournament.current_round, "round_robin")
+        
+        # Top 10 players for the standings table
+        sorted_players = tournament.get_standings(limit=10)
+        users = await self.get_users([
+            *self._match_user_ids(current_matches),
+            *(player_id for player_id, _ in sorted_players)
+        ], guild=guild)
         
         # Get total rounds
         player_count = len(tournament.participants)
@@ -376,37 +419,18 @@ class BracketService:
         
         # Add current matches to the embed
         if current_matches:
+            match_fields = []
             for match in current_matches:
-                player1 = await self.bot.fetch_user(match.player1)
-                player2 = await self.bot.fetch_user(match.player2)
+                player1 = users[match.player1]
+                player2 = users[match.player2]
                 
-                # Determine match status
-                status = "🟡 In Progress"
-                if match.status == MatchStatus.COMPLETED:
-                    winner = await self.bot.fetch_user(match.winner)
-                    status = f"✅ Complete - {match.score} - Winner: {winner.display_name}"
-                elif match.status == MatchStatus.AWAITING_CONFIRMATION:
-                    status = f"🟠 Waiting for confirmation - {match.score}"
-                elif match.status == MatchStatus.DRAW:
-                    status = f"🟠 Draw - {match.score}"
-                elif match.status == MatchStatus.DQ:
-                    status = "⛔ Disqualification"
+                status = self._format_match_status(match, users)
                 
-                # Check if match is scheduled
-                if match.status == MatchStatus.PENDING and match.scheduled_time:
-                    try:
-                        scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                        timestamp = int(scheduled_time.timestamp())
-                        schedule_info = f"\n⏰ Scheduled: <t:{timestamp}:F>"
-                        status += schedule_info
-                    except:
-                        pass
-                
-                embed.add_field(
-                    name=f"Match {match.match_id}",
-                    value=f"{player1.display_name} vs {player2.display_name}\n{status}",
-                    inline=False
-                )
+                match_fields.append((
+                    f"Match {match.match_id}",
+                    f"{player1.display_name} vs {player2.display_name}\n{status}"
+                ))
+            self._add_match_fields(embed, match_fields, reserved=1)
         else:
             embed.add_field(
                 name="No Matches",
@@ -415,31 +439,24 @@ class BracketService:
             )
         
         # Add standings table
-        sorted_players = sorted(
-            tournament.participants.items(),
-            key=lambda x: (x[1].match_points, x[1].tiebreaker_points),
-            reverse=True
-        )
-        
-        standings = "Current Standings:\n"
-        for i, (player_id, player_info) in enumerate(sorted_players[:10], 1):
-            player = await self.bot.fetch_user(player_id)
-            standings += f"{i}. {player.display_name} - {player_info.match_points} pts " \
-                         f"({player_info.wins}-{player_info.losses}-{player_info.draws})\n"
+        standings = ["Current Standings:"]
+        for i, (player_id, player_info) in enumerate(sorted_players, 1):
+            player = users[player_id]
+            standings.append(f"{i}. {player.display_name} - {player_info.standings_line}")
         
         embed.add_field(
             name="Standings",
-            value=standings,
+            value="\n".join(standings),
             inline=False
         )
         
         return embed
     
-    async def _create_elimination_embed(self, tournament: Tournament) -> discord.Embed:
+    async def _create_elimination_embed(self, tournament: Tournament, guild: Optional[discord.Guild] = None) -> discord.Embed:
         """Create visualization for top cut elimination bracket"""
         # Get current round matches
-        current_matches = [m for m in tournament.matches.values() 
-                           if m.round_num == tournament.current_round and m.bracket == "elimination"]
+        current_matches = tournament.matches_in(tournament.current_round, "elimination")
+        users = await self.get_users(self._match_user_ids(current_matches), guild=guild)
         
         # Create embed
         embed = discord.Embed(
@@ -449,164 +466,119 @@ class BracketService:
         )
         
         # Add current matches to the embed
+        match_fields = []
         for match in current_matches:
-            player1 = await self.bot.fetch_user(match.player1)
-            player2 = await self.bot.fetch_user(match.player2)
+            player1 = users[match.player1]
+            player2 = users[match.player2]
             
             # Get player seeds/records
-            p1_record = f"{tournament.participants[player1.id].wins}-{tournament.participants[player1.id].losses}"
-            p2_record = f"{tournament.participants[player2.id].wins}-{tournament.participants[player2.id].losses}"
+            p1_record = tournament.participants[match.player1].record_str
+            p2_record = tournament.participants[match.player2].record_str
             
-            # Determine match status
-            status = "🟡 In Progress"
-            if match.status == MatchStatus.COMPLETED:
-                winner = await self.bot.fetch_user(match.winner)
-                status = f"✅ Complete - {match.score} - Winner: {winner.display_name}"
-            elif match.status == MatchStatus.AWAITING_CONFIRMATION:
-                status = f"🟠 Waiting for confirmation - {match.score}"
-            elif match.status == MatchStatus.DQ:
-                status = "⛔ Disqualification"
-            
-            # Check if match is scheduled
-            if match.status == MatchStatus.PENDING and match.scheduled_time:
-                try:
-                    scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                    timestamp = int(scheduled_time.timestamp())
-                    schedule_info = f"\n⏰ Scheduled: <t:{timestamp}:F>"
-                    status += schedule_info
-                except:
-                    pass
+            status = self._format_match_status(match, users)
             
-            embed.add_field(
-                name=f"Match {match.match_id}",
-                value=f"{player1.display_name} ({p1_record}) vs {player2.display_name} ({p2_record})\n{status}",
-                inline=False
-            )
+            match_fields.append((
+                f"Match {match.match_id}",
+                f"{player1.display_name} ({p1_record}) vs {player2.display_name} ({p2_record})\n{status}"
+            ))
+        self._add_match_fields(embed, match_fields)
         
         # Add progress information
-        total_rounds = self._calculate_total_rounds(tournament.config["top_cut"])
+        top_cut = tournament.config["top_cut"]
+        total_rounds = self._calculate_total_rounds(top_cut)
         embed.set_footer(text=f"Elimination Round {tournament.current_round} of {total_rounds} | "
-                              f"Top Cut: {tournament.config['top_cut']} players")
+                              f"Top Cut: {top_cut} players")
         
         return embed
     
-    async def _create_generic_bracket_embed(self, tournament: Tournament) -> discord.Embed:
+    async def _create_generic_bracket_embed(self, tournament: Tournament, guild: Optional[discord.Guild] = None) -> discord.Embed:
         """Create a generic bracket visualization for any tournament type"""
         # Get current round matches
         current_matches = [m for m in tournament.matches.values() 
                          if m.round_num == tournament.current_round]
+        users = await self.get_users(self._match_user_ids(current_matches), guild=guild)
         
         # Create embed
         embed = discord.Embed(
             title=f"Tournament Bracket - Round {tournament.current_round}",
             description=f"Tournament: {tournament.name} | "
-                        f"Format: {tournament.config['tournament_mode'].replace('_', ' ').title()}",
+                        f"Format: {_MODE_DISPLAY.get(tournament.config['tournament_mode'], tournament.config['tournament_mode'])}",
             color=discord.Color.blue()
         )
         
         # Add match info
+        match_fields = []
         for match in current_matches:
-            player1 = await self.bot.fetch_user(match.player1)
-            player2 = await self.bot.fetch_user(match.player2)
+            player1 = users[match.player1]
+            player2 = users[match.player2]
             
-            # Determine match status
-            status = "🟡 In Progress"
-            if match.status == MatchStatus.COMPLETED:
-                winner = await self.bot.fetch_user(match.winner)
-                status = f"✅ Complete - {match.score} - Winner: {winner.display_name}"
-            elif match.status == MatchStatus.AWAITING_CONFIRMATION:
-                status = f"🟠 Waiting for confirmation - {match.score}"
-            elif match.status == MatchStatus.DRAW:
-                status = f"🟠 Draw - {match.score}"
-            elif match.status == MatchStatus.DQ:
-                status = "⛔ Disqualification"
+            status = self._format_match_status(match, users, show_schedule=False)
             
-            embed.add_field(
-                name=f"Match {match.match_id}",
-                value=f"{player1.mention} vs {player2.mention}\n{status}",
-                inline=False
-            )
+            match_fields.append((
+                f"Match {match.match_id}",
+                f"{player1.mention} vs {player2.mention}\n{status}"
+            ))
+        self._add_match_fields(embed, match_fields)
         
         # Add info
         embed.set_footer(text=f"Round {tournament.current_round} | "
-                            f"Active Players: {len([p for p in tournament.participants.values() if p.active])}")
+                            f"Active Players: {sum(1 for p in tournament.participants.values() if p.active)}")
         
         return embed
     
     async def create_stats_embed(self, ctx, tournament: Tournament) -> discord.Embed:
         """Create tournament statistics embed"""
-        # Create main embed
-        embed = discord.Embed(
-            title=f"Tournament Statistics: {tournament.name}",
-            color=discord.Color.blue()
-        )
+        guild = getattr(ctx, "guild", None)
+        fields = []
         
         # Add tournament info
         status = "In Progress" if tournament.is_started else "Not Started"
         if tournament.meta["end_time"]:
             status = "Completed"
-        
-        embed.add_field(
-            name="Status",
-            value=status,
-            inline=True
-        )
-        
-        embed.add_field(
-            name="Mode",
-            value=tournament.config["tournament_mode"].replace("_", " ").title(),
-            inline=True
-        )
-        
-        embed.add_field(
-            name="Format",
-            value=f"Best of {tournament.config['best_of']}",
-            inline=True
-        )
+        mode = tournament.config["tournament_mode"]
+        fields.append({"name": "Status", "value": status, "inline": True})
+        fields.append({"name": "Mode", "value": _MODE_DISPLAY.get(mode, mode), "inline": True})
+        fields.append({"name": "Format", "value": f"Best of {tournament.config['best_of']}", "inline": True})
         
         # Add participation stats
-        active_players = len([p for p in tournament.participants.values() if p.active])
-        
-        embed.add_field(
-            name="Participants",
-            value=f"Total: {len(tournament.participants)}\nActive: {active_players}",
-            inline=True
-        )
+        active_players = sum(1 for p in tournament.participants.values() if p.active)
+        fields.append({
+            "name": "Participants",
+            "value": f"Total: {len(tournament.participants)}\nActive: {active_players}",
+            "inline": True
+        })
         
         # Add match stats
-        completed_matches = len([m for m in tournament.matches.values() 
-                               if m.status in [MatchStatus.COMPLETED, MatchStatus.DRAW, MatchStatus.DQ]])
-        pending_matches = len([m for m in tournament.matches.values() if m.status == MatchStatus.PENDING])
-        
-        embed.add_field(
-            name="Matches",
-            value=f"Total: {len(tournament.matches)}\nCompleted: {completed_matches}\nPending: {pending_matches}",
-            inline=True
-        )
+        completed_matches = pending_matches = scheduled_matches = 0
+        for m in tournament.matches.values():
+            match_status = m.status
+            if match_status == MatchStatus.PENDING:
+                pending_matches += 1
+                if m.scheduled_time:
+                    scheduled_matches += 1
+            elif match_status in (MatchStatus.COMPLETED, MatchStatus.DRAW, MatchStatus.DQ):
+                completed_matches += 1
+        
+        fields.append({
+            "name": "Matches",
+            "value": f"Total: {len(tournament.matches)}\nCompleted: {completed_matches}\nPending: {pending_matches}",
+            "inline": True
+        })
         
         # Add scheduled matches count
-        scheduled_matches = len([m for m in tournament.matches.values() 
-                               if m.status == MatchStatus.PENDING and m.scheduled_time])
         if scheduled_matches > 0:
-            embed.add_field(
-                name="Scheduled",
-                value=f"{scheduled_matches} matches",
-                inline=True
-            )
+            fields.append({"name": "Scheduled", "value": f"{scheduled_matches} matches", "inline": True})
         
         # Add current phase info
         if tournament.is_started:
-            phase_info = f"Current Phase: {tournament.meta['current_phase'].replace('_', ' ').title()}\n"
+            phase = tournament.meta['current_phase']
+            phase_info = f"Current Phase: {_PHASE_DISPLAY.get(phase, phase)}\n"
             phase_info += f"Current Round: {tournament.current_round}"
             
-            if tournament.config["tournament_mode"] == TournamentMode.SWISS:
+            if mode == TournamentMode.SWISS:
                 phase_info += f" of {tournament.config['rounds_swiss']}"
                 
-            embed.add_field(
-                name="Progress",
-                value=phase_info,
-                inline=True
-            )
+            fields.append({"name": "Progress", "value": phase_info, "inline": True})
         
         # Add timing info
         timing_info = ""
@@ -628,38 +600,40 @@ class BracketService:
         else:
             timing_info = "Not started yet"
         
-        embed.add_field(
-            name="Timing",
-            value=timing_info,
-            inline=False
-        )
+        fields.append({"name": "Timing", "value": timing_info, "inline": False})
         
         # Add top players
         if tournament.participants:
-            sorted_players = sorted(
-                tournament.participants.items(),
-                key=lambda x: (x[1].match_points, x[1].wins),
-                reverse=True
+            top = heapq.nlargest(5, tournament.participants.values(), key=attrgetter("match_points", "wins"))
+            sorted_players = [(player_info.user_id, player_info) for player_info in top]
+            users = await self.get_users(
+                (player_id for player_id, _ in sorted_players), guild=guild
             )
             
-            top_players = ""
-            for i, (player_id, player_info) in enumerate(sorted_players[:5], 1):
-                player = await self.bot.fetch_user(player_id)
+            top_players = []
+            for i, (player_id, player_info) in enumerate(sorted_players, 1):
+                player = users[player_id]
                 active_status = "✓" if player_info.active else "⛔"
-                top_players += f"{i}. {player.display_name} {active_status} - " \
-                              f"{player_info.wins}-{player_info.losses}" \
-                              f"{f'-{player_info.draws}' if player_info.draws > 0 else ''}\n"
+                top_players.append(f"{i}. {player.display_name} {active_status} - "
+                                   f"{player_info.wins}-{player_info.losses}"
+                                   f"{f'-{player_info.draws}' if player_info.draws > 0 else ''}")
             
-            embed.add_field(
-                name="Top Players",
-                value=top_players or "No player data",
-                inline=False
-            )
-        
-        return embed
+            fields.append({
+                "name": "Top Players",
+                "value": "\n".join(top_players) or "No player data",
+                "inline": False
+            })
+        
+        # Build the embed in one pass instead of repeated add_field calls
+        return discord.Embed.from_dict({
+            "title": f"Tournament Statistics: {tournament.name}",
+            "color": discord.Color.blue().value,
+            "fields": fields
+        })
         
     def _calculate_total_rounds(self, player_count: int) -> int:
         """Calculate the total number of rounds needed for a bracket"""
         if player_count <= 1:
             return 0
-        return math.ceil(math.log2(player_count))
+        # (n - 1).bit_length() == ceil(log2(n)) for n >= 2, without float rounding
+        return (player_count - 1).bit_length()
@@ -1,10 +1,20 @@
 import discord
+import asyncio
 from discord.ext import commands
 from typing import Dict, Optional, List, Any, Union
 from datetime import datetime
+from functools import partial
 
 from ..core.models import Tournament, Participant, DeckInfo
-from ..utils.constants import VerificationStatus, ERROR_MESSAGES
+from ..utils.constants import VerificationStatus, get_error
+from ..utils.backup import BURST_COALESCE_DELAY
+
+# Image formats accepted for deck screenshots
+_ALLOWED_DECK_IMAGE_TYPES = frozenset({"image/png", "image/jpeg", "image/webp", "image/gif"})
+
+# Static parts of the registration confirmation, resolved once at import
+_REGISTERED_TITLE = "Registration Successful!"
+_REGISTERED_COLOR = discord.Color.green().value
 
 
 class RegistrationService:
@@ -15,172 +25,147 @@ class RegistrationService:
         self.bot = bot
         self.logger = logger
         self.backup = backup
+        self._dm_tasks = set()
     async def register_player(self, ctx, tournament: Tournament,
                              main_deck: discord.Attachment = None,
                              extra_deck: discord.Attachment = None,
                              side_deck: discord.Attachment = None) -> bool:
         """Register a player for the tournament"""
         is_interaction = hasattr(ctx, 'response')
+        if is_interaction:
+            send = ctx.response.send_message
+            send_private = partial(send, ephemeral=True)
+        else:
+            send = send_private = ctx.send
         user = ctx.user if is_interaction else ctx.author
         guild = ctx.guild
         if not tournament.registration_open:
-            if is_interaction:
-                await ctx.response.send_message(ERROR_MESSAGES["REGISTRATION_CLOSED"], ephemeral=True)
-            else:
-                await ctx.send(ERROR_MESSAGES["REGISTRATION_CLOSED"])
+            await send_private(get_error("REGISTRATION_CLOSED"))
             return False
         if user.id in tournament.participants:
-            if is_interaction:
-                await ctx.response.send_message(ERROR_MESSAGES["ALREADY_REGISTERED"], ephemeral=True)
-            else:
-                await ctx.send(ERROR_MESSAGES["ALREADY_REGISTERED"])
+            await send_private(get_error("ALREADY_REGISTERED"))
             return False
-        attachments = [a for a in [main_deck, extra_deck, side_deck] if a is not None]
-        if tournament.config["deck_check_required"] and not attachments:
-            if is_interaction:
-                await ctx.response.send_message(ERROR_MESSAGES["DECK_REQUIRED"], ephemeral=True)
-            else:
-                await ctx.send(ERROR_MESSAGES["DECK_REQUIRED"])
+        has_deck = main_deck is not None or extra_deck is not None or side_deck is not None
+        if not has_deck and tournament.config["deck_check_required"]:
+            await send_private(get_error("DECK_REQUIRED"))
             return False
         deck_info = None
-        if attachments:
+        if has_deck:
             try:
-                deck_info = await self._validate_deck_images(attachments)
+                deck_info = await self._validate_deck_images([main_deck, extra_deck, side_deck])
             except ValueError as e:
-                if is_interaction:
-                    await ctx.response.send_message(f"Deck validation failed: {str(e)}")
-                else:
-                    await ctx.send(f"Deck validation failed: {str(e)}")
+                await send(f"Deck validation failed: {e}")
                 return False
-            except Exception as e:
-                if is_interaction:
-                    await ctx.response.send_message("An error occurred while validating your deck. Please try again.")
-                else:
-                    await ctx.send("An error occurred while validating your deck. Please try again.")
+            except Exception:
+                self.logger.log_exception(guild.id, "deck_validation", "Deck validation failure for user %s", user.id)
+                await send("An error occurred while validating your deck. Please try again.")
                 return False
         participant = Participant(
             user_id=user.id,
             deck_info=deck_info,
-            seed=len(tournament.participants) + 1,
+            seed=tournament.take_seed(),
             registration_time=datetime.now().isoformat(),
             active=True
         )
-        tournament.participants[user.id] = participant
+        tournament.add_participant(participant)
         self.logger.log_tournament_event(guild.id, "registration", {
             "user_id": user.id,
             "deck_info": deck_info.to_dict() if deck_info else None
         })
-        self.backup.save_tournament_state(
-            guild.id,
-            tournament.to_dict()
-        )
-        embed = discord.Embed(
-            title="Registration Successful!",
-            description=f"Player: {user.mention}",
-            color=discord.Color.green()
-        )
-        embed.add_field(
-            name="Tournament",
-            value=tournament.name,
-            inline=True
-        )
-        embed.add_field(
-            name="Format",
-            value=tournament.config["tournament_mode"].replace("_", " ").title(),
-            inline=True
-        )
+        tournament.mark_changed()
+        # Registrations come in bursts when sign-ups open; one write covers the whole burst
+        self.backup.mark_dirty(guild.id, tournament, BURST_COALESCE_DELAY)
+        fields = [
+            {"name": "Tournament", "value": tournament.name, "inline": True},
+            {
+                "name": "Format",
+                "value": tournament.config["tournament_mode"].replace("_", " ").title(),
+                "inline": True
+            }
+        ]
         if deck_info:
-            embed.add_field(
-                name="Deck Status",
-                value="Submitted - Awaiting Verification",
-                inline=False
-            )
-        if is_interaction:
-            await ctx.response.send_message(embed=embed)
-        else:
-            await ctx.send(embed=embed)
+            fields.append({"name": "Deck Status", "value": "Submitted - Awaiting Verification", "inline": False})
+        embed = discord.Embed.from_dict({
+            "title": _REGISTERED_TITLE,
+            "description": f"Player: {user.mention}",
+            "color": _REGISTERED_COLOR,
+            "fields": fields
+        })
+        await send(embed=embed)
         return True
-    async def _validate_deck_images(self, attachments: List[discord.Attachment]) -> DeckInfo:
-        """Validate submitted deck images"""
-        if not attachments:
+    async def _validate_deck_images(self, attachments: List[Optional[discord.Attachment]]) -> DeckInfo:
+        """Validate submitted deck images, given as exactly the main, extra and side deck slots with None for gaps"""
+        if all(a is None for a in attachments):
             raise ValueError("No deck images provided")
-        if len(attachments) > 3:
-            raise ValueError("Maximum of 3 deck images allowed (Main Deck, Extra Deck, Side Deck)")
-        if len(attachments) < 1:
-            raise ValueError("At least one deck image (Main Deck) is required")
-        main_deck = attachments[0]
-        extra_deck = attachments[1] if len(attachments) > 1 else None
-        side_deck = attachments[2] if len(attachments) > 2 else None
-        for deck in [d for d in [main_deck, extra_deck, side_deck] if d is not None]:
-            if not deck.content_type.startswith('image/'):
-                raise ValueError(f"File {deck.filename} is not an image")
+        # Validate every deck slot concurrently; each image keeps its slot even if an earlier one is missing
+        main_url, extra_url, side_url = await asyncio.gather(*(self._validate_deck_image(a) for a in attachments))
         return DeckInfo(
-            main_deck_url=main_deck.url,
-            extra_deck_url=extra_deck.url if extra_deck else None,
-            side_deck_url=side_deck.url if side_deck else None,
+            main_deck_url=main_url,
+            extra_deck_url=extra_url,
+            side_deck_url=side_url,
             verification_status=VerificationStatus.PENDING
         )
+    async def _validate_deck_image(self, attachment: Optional[discord.Attachment]) -> Optional[str]:
+        """Validate a single deck image and return its URL, or None for an empty slot"""
+        if attachment is None:
+            return None
+        if attachment.content_type not in _ALLOWED_DECK_IMAGE_TYPES:
+            raise ValueError(f"File {attachment.filename} is not an image")
+        return attachment.url
     async def verify_deck(self, ctx, tournament: Tournament,
                         player_id: int, status: str,
                         notes: str = None) -> bool:
         """Verify a player's deck"""
         is_interaction = hasattr(ctx, 'response')
+        send = ctx.response.send_message if is_interaction else ctx.send
         mod_user = ctx.user if is_interaction else ctx.author
-        if player_id not in tournament.participants:
-            if is_interaction:
-                await ctx.response.send_message("Player not found in tournament.")
-            else:
-                await ctx.send("Player not found in tournament.")
+        participant = tournament.participants.get(player_id)
+        if participant is None:
+            await send("Player not found in tournament.")
             return False
-        participant = tournament.participants[player_id]
-        if not participant.deck_info:
-            if is_interaction:
-                await ctx.response.send_message("This player has not submitted deck information.")
-            else:
-                await ctx.send("This player has not submitted deck information.")
+        deck_info = participant.deck_info
+        if not deck_info:
+            await send("This player has not submitted deck information.")
             return False
-        participant.deck_info.verification_status = status
-        participant.deck_info.verification_notes = notes
-        participant.deck_info.verified_by = mod_user.id
-        participant.deck_info.verified_at = datetime.now().isoformat()
+        deck_info.verification_status = status
+        deck_info.verification_notes = notes
+        deck_info.verified_by = mod_user.id
+        deck_info.verified_at = datetime.now().isoformat()
         self.logger.log_tournament_event(ctx.guild.id, "deck_verification", {
             "player_id": player_id,
             "verified_by": mod_user.id,
             "status": status,
             "notes": notes
         })
-        self.backup.save_tournament_state(
-            ctx.guild.id,
-            tournament.to_dict()
-        )
+        tournament.mark_changed()
+        self.backup.mark_dirty(ctx.guild.id, tournament)
         player = await self.bot.fetch_user(player_id)
-        embed = discord.Embed(
-            title="Deck Verification",
-            description=f"Deck for {player.mention} has been verified.",
-            color=discord.Color.green() if status == VerificationStatus.APPROVED else discord.Color.red()
-        )
-        embed.add_field(
-            name="Status",
-            value=status.title(),
-            inline=True
-        )
-        embed.add_field(
-            name="Verified By",
-            value=mod_user.mention,
-            inline=True
-        )
+        fields = [
+            {"name": "Status", "value": status.title(), "inline": True},
+            {"name": "Verified By", "value": mod_user.mention, "inline": True}
+        ]
         if notes:
-            embed.add_field(
-                name="Notes",
-                value=notes,
-                inline=False
-            )
-        if is_interaction:
-            await ctx.response.send_message(embed=embed)
-        else:
-            await ctx.send(embed=embed)
+            fields.append({"name": "Notes", "value": notes, "inline": False})
+        color = discord.Color.green() if status == VerificationStatus.APPROVED else discord.Color.red()
+        embed = discord.Embed.from_dict({
+            "title": "Deck Verification",
+            "description": f"Deck for {player.mention} has been verified.",
+            "color": color.value,
+            "fields": fields
+        })
+        await send(embed=embed)
+        # DM the player in the background so the moderator's reply isn't held up
+        task = asyncio.create_task(self._safe_dm(player, embed))
+        self._dm_tasks.add(task)
+        task.add_done_callback(self._dm_tasks.discard)
+        return True
+    def cancel_pending_dms(self):
+        """Cancel verification DMs that are still being sent"""
+        for task in list(self._dm_tasks):
+            task.cancel()
+    async def _safe_dm(self, user: discord.abc.User, embed: discord.Embed):
+        """DM a user, ignoring users who cannot be messaged"""
         try:
-            await player.send(embed=embed)
-        except:
+            await user.send(embed=embed)
+        except discord.HTTPException:
             pass
-        return True
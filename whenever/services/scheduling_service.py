@@ -1,23 +1,85 @@
 import discord
 from discord.ext import commands
-from typing import Dict, Optional, List, Any, Union
+from typing import Dict, Optional, List, Any, Union, Tuple, Callable, Awaitable
 from datetime import datetime, timedelta
 import asyncio
+import functools
+import heapq
+import itertools
+import re
+import time
 import dateparser
+from operator import itemgetter
 
 from ..core.models import Tournament, Match
-from ..utils.constants import MatchStatus, ERROR_MESSAGES, ROUND_MESSAGES
+from .bracket_service import BracketService
+from ..utils.constants import MatchStatus, get_error
+
+# Only matches that have not been played yet can be scheduled
+_SCHEDULABLE_STATUSES = frozenset({MatchStatus.PENDING})
+
+# Formats handled without dateparser: "in 2h", "in 30 mins", ISO timestamps
+_REL_RE = re.compile(r'^\s*in\s+(\d+)\s*(m|mins?|minutes?|h|hrs?|hours?|d|days?)\s*$', re.I)
+_ISO_RE = re.compile(r'^\s*\d{4}-\d{2}-\d{2}T')
+_REL_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+
+MAX_CONCURRENT_DMS = 5  # DMs in flight at once from the background sender
+
+# Slack added to reminder waits so the loop never wakes just before a reminder is due
+_CLOCK_SLACK = time.get_clock_info("monotonic").resolution
+
+
+@functools.lru_cache(maxsize=512)
+def _dateparser_parse(time_str: str, minute: int) -> Optional[datetime]:
+    """dateparser lookup, cached per input for the current minute (the minute only keys the cache)"""
+    return dateparser.parse(time_str, settings={'PREFER_DATES_FROM': 'future'})
+
+
+def _parse_time(time_str: str, now: datetime) -> Optional[datetime]:
+    """Parse a user supplied match time, trying the common formats before dateparser"""
+    if _ISO_RE.match(time_str):
+        try:
+            parsed = datetime.fromisoformat(time_str.strip())
+        except ValueError:
+            parsed = None
+        if parsed is not None:
+            if parsed.tzinfo is not None:
+                parsed = parsed.astimezone().replace(tzinfo=None)
+            return parsed
+    relative = _REL_RE.match(time_str)
+    if relative:
+        amount, unit = relative.groups()
+        return now + timedelta(**{_REL_UNITS[unit[0].lower()]: int(amount)})
+    return _dateparser_parse(time_str.strip().lower(), int(now.timestamp() // 60))
 
 
 class SchedulingService:
     """
     Service for handling match scheduling and reminders
     """
-    def __init__(self, bot, logger, backup):
+    def __init__(self, bot, logger, backup, guild_settings: Optional[Dict[int, Dict[str, Any]]] = None,
+                 bracket_service=None,
+                 get_tournament: Optional[Callable[[int], Awaitable[Optional[Tournament]]]] = None):
         self.bot = bot
         self.logger = logger
         self.backup = backup
-        self.reminder_tasks = {}  # Dict of match_id: asyncio Task
+        # User lookups go through the bracket service so both share one expiring cache
+        self.bracket_service = bracket_service if bracket_service is not None else BracketService(bot, logger)
+        # Shared with the manager, so settings changes are seen without invalidation
+        self.guild_settings = guild_settings if guild_settings is not None else {}
+        # Looks up a guild's live tournament when a reminder fires, since cached tournaments can be reloaded
+        self.get_tournament = get_tournament
+        # Min-heap of (due event loop time, sequence, (guild_id, match_id))
+        self._reminder_heap: List[Tuple[float, int, Tuple[int, int]]] = []
+        self._reminder_due: Dict[Tuple[int, int], float] = {}  # Latest due time per match
+        self._reminder_seq = itertools.count()
+        self._reminder_wakeup = asyncio.Event()
+        self._reminder_task: Optional[asyncio.Task] = None
+        # DMs are queued and sent in the background so commands never wait on them
+        self._dm_queue: asyncio.Queue = asyncio.Queue()
+        self._dm_slots = asyncio.Semaphore(MAX_CONCURRENT_DMS)
+        self._dm_task: Optional[asyncio.Task] = None
+        self._dm_sends = set()
     
     async def schedule_match(self, ctx, tournament: Tournament, 
                            opponent: discord.Member, time_str: str) -> bool:
@@ -27,30 +89,24 @@ class SchedulingService:
         
         if not tournament.is_started:
             if is_interaction:
-                await ctx.response.send_message(ERROR_MESSAGES["TOURNAMENT_NOT_STARTED"])
+                await ctx.response.send_message(get_error("TOURNAMENT_NOT_STARTED"))
             else:
-                await ctx.send(ERROR_MESSAGES["TOURNAMENT_NOT_STARTED"])
+                await ctx.send(get_error("TOURNAMENT_NOT_STARTED"))
             return False
         
         # Find match between players
-        match_id = None
-        for mid, match in tournament.matches.items():
-            if match.status != MatchStatus.PENDING:
-                continue
-            if (match.player1 == user.id and match.player2 == opponent.id) or \
-               (match.player2 == user.id and match.player1 == opponent.id):
-                match_id = mid
-                break
+        match = tournament.match_between(user.id, opponent.id, _SCHEDULABLE_STATUSES)
         
-        if match_id is None:
+        if match is None:
             if is_interaction:
-                await ctx.response.send_message(ERROR_MESSAGES["NO_MATCH_FOUND"])
+                await ctx.response.send_message(get_error("NO_MATCH_FOUND"))
             else:
-                await ctx.send(ERROR_MESSAGES["NO_MATCH_FOUND"])
+                await ctx.send(get_error("NO_MATCH_FOUND"))
             return False
         
         # Parse the time string
-        parsed_time = dateparser.parse(time_str, settings={'PREFER_DATES_FROM': 'future'})
+        now = datetime.now()
+        parsed_time = _parse_time(time_str, now)
         if not parsed_time:
             if is_interaction:
                 await ctx.response.send_message("I couldn't understand that time format. Please use a standard format like 'tomorrow at 3pm' or 'in 2 hours'.")
@@ -59,7 +115,6 @@ class SchedulingService:
             return False
         
         # Check if the time is in the future
-        now = datetime.now()
         if parsed_time < now:
             if is_interaction:
                 await ctx.response.send_message("The scheduled time must be in the future.")
@@ -68,14 +123,15 @@ class SchedulingService:
             return False
         
         # Update match with scheduled time
-        match = tournament.matches[match_id]
+        match_id = match.match_id
         match.scheduled_time = parsed_time.isoformat()
         
         # Store in scheduled matches dict for easy lookup
         tournament.meta["scheduled_matches"][str(match_id)] = parsed_time.isoformat()
         
         # Save state
-        self.backup.save_tournament_state(tournament.meta["guild_id"], tournament.to_dict())
+        tournament.mark_changed()
+        self.backup.mark_dirty(tournament.meta["guild_id"], tournament)
         
         # Calculate reminder time (default 15 minutes before match)
         reminder_minutes = tournament.config.get("reminder_minutes", 15)
@@ -83,18 +139,7 @@ class SchedulingService:
         
         # Schedule reminder task if needed
         if reminder_time > now and tournament.config.get("send_reminders", True):
-            # Calculate seconds until reminder
-            seconds_until_reminder = (reminder_time - now).total_seconds()
-            
-            # Cancel any existing reminder task for this match
-            if match_id in self.reminder_tasks and not self.reminder_tasks[match_id].done():
-                self.reminder_tasks[match_id].cancel()
-            
-            # Schedule new reminder task
-            task = asyncio.create_task(
-                self._send_match_reminder(tournament, match_id, seconds_until_reminder)
-            )
-            self.reminder_tasks[match_id] = task
+            self._schedule_reminder(tournament.meta["guild_id"], match_id, (reminder_time - now).total_seconds())
         
         # Create confirmation embed
         embed = discord.Embed(
@@ -140,21 +185,80 @@ class SchedulingService:
             "scheduled_time": parsed_time.isoformat()
         })
         
-        # Try to DM the opponent
-        try:
-            await opponent.send(embed=embed)
-        except:
-            pass
+        # DM the opponent in the background
+        self._queue_dm(tournament.meta["guild_id"], opponent, embed)
             
         return True
     
-    async def _send_match_reminder(self, tournament: Tournament, match_id: int, delay_seconds: float):
+    def _queue_dm(self, guild_id: int, target: discord.abc.Messageable, embed: discord.Embed):
+        """Queue a DM for the background sender"""
+        self._dm_queue.put_nowait((guild_id, target, embed))
+        if self._dm_task is None or self._dm_task.done():
+            self._dm_task = asyncio.create_task(self._dm_worker())
+    
+    async def _dm_worker(self):
+        """Send queued DMs, keeping at most MAX_CONCURRENT_DMS in flight"""
+        while True:
+            item = await self._dm_queue.get()
+            await self._dm_slots.acquire()
+            task = asyncio.create_task(self._send_dm(*item))
+            self._dm_sends.add(task)
+            task.add_done_callback(self._dm_sends.discard)
+    
+    async def _send_dm(self, guild_id: int, target: discord.abc.Messageable, embed: discord.Embed):
+        """Send one queued DM; discord.py already waits out rate limits before sending"""
+        try:
+            await target.send(embed=embed)
+        except discord.HTTPException as e:
+            self.logger.log_error(guild_id, "dm_send", str(e))
+        finally:
+            self._dm_slots.release()
+    
+    def _schedule_reminder(self, guild_id: int, match_id: int, delay: float):
+        """Queue a reminder delay seconds from now, replacing any earlier reminder for the same match"""
+        key = (guild_id, match_id)
+        # Due times use the event loop's monotonic clock, unaffected by wall clock adjustments
+        due = asyncio.get_running_loop().time() + max(0.0, delay)
+        # Any older heap entry for this match no longer matches _reminder_due and is skipped
+        self._reminder_due[key] = due
+        heapq.heappush(self._reminder_heap, (due, next(self._reminder_seq), key))
+        if self._reminder_task is None or self._reminder_task.done():
+            self._reminder_task = asyncio.create_task(self._reminder_loop())
+        self._reminder_wakeup.set()
+    
+    async def _reminder_loop(self):
+        """Sleep until the earliest queued reminder is due and send it"""
+        heap = self._reminder_heap
+        loop = asyncio.get_running_loop()
+        while True:
+            self._reminder_wakeup.clear()
+            if not heap:
+                await self._reminder_wakeup.wait()
+                continue
+            delay = heap[0][0] - loop.time()
+            if delay > 0:
+                # Woken early when a new reminder is queued
+                try:
+                    await asyncio.wait_for(self._reminder_wakeup.wait(), timeout=delay + _CLOCK_SLACK)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            due, _, key = heapq.heappop(heap)
+            if self._reminder_due.get(key) != due:
+                continue  # Superseded by a reschedule
+            del self._reminder_due[key]
+            try:
+                await self._send_match_reminder(*key)
+            except Exception as e:
+                self.logger.log_error(key[0], "match_reminder", str(e))
+    
+    async def _send_match_reminder(self, guild_id: int, match_id: int):
         """Send a reminder for an upcoming match"""
-        # Wait until it's time to send the reminder
-        await asyncio.sleep(delay_seconds)
-        
-        # Check if match still exists and is pending
-        if match_id not in tournament.matches:
+        if self.get_tournament is None:
+            return
+        tournament = await self.get_tournament(guild_id)
+        # Check if the tournament and match still exist and the match is pending
+        if tournament is None or match_id not in tournament.matches:
             return
             
         match = tournament.matches[match_id]
@@ -162,14 +266,9 @@ class SchedulingService:
             return
             
         # Get player info
-        try:
-            player1 = await self.bot.fetch_user(match.player1)
-            player2 = await self.bot.fetch_user(match.player2)
-            
-            if not player1 or not player2:
-                return
-        except:
-            return
+        users = await self.bracket_service.get_users((match.player1, match.player2))
+        player1 = users[match.player1]
+        player2 = users[match.player2]
             
         # Create reminder embed
         embed = discord.Embed(
@@ -179,15 +278,13 @@ class SchedulingService:
         )
         
         # Get scheduled time
-        try:
-            scheduled_time = datetime.fromisoformat(match.scheduled_time)
+        scheduled_marker = match.schedule_marker("F")
+        if scheduled_marker:
             embed.add_field(
                 name="Scheduled Time",
-                value=f"<t:{int(scheduled_time.timestamp())}:F>",
+                value=scheduled_marker,
                 inline=False
             )
-        except:
-            pass
             
         # Add match details
         embed.add_field(
@@ -203,27 +300,21 @@ class SchedulingService:
         )
         
         # Try to get announcement channel
-        try:
-            guild = self.bot.get_guild(tournament.meta["guild_id"])
-            if guild:
-                announcement_channel_id = guild.settings.get("announcement_channel_id")
-                if announcement_channel_id:
-                    channel = self.bot.get_channel(announcement_channel_id)
-                    if channel:
-                        await channel.send(embed=embed)
-        except:
-            pass
-            
-        # Also send DMs to players if possible
-        try:
-            await player1.send(embed=embed)
-        except:
-            pass
-            
-        try:
-            await player2.send(embed=embed)
-        except:
-            pass
+        channel = None
+        announcement_channel_id = self.guild_settings.get(guild_id, {}).get("announcement_channel_id")
+        if announcement_channel_id:
+            channel = self.bot.get_partial_messageable(announcement_channel_id, guild_id=guild_id)
+        
+        # DM both players in the background and announce in the channel
+        for player in (player1, player2):
+            # Players Discord could not return are only shown by mention
+            if isinstance(player, discord.abc.Messageable):
+                self._queue_dm(guild_id, player, embed)
+        if channel:
+            try:
+                await channel.send(embed=embed)
+            except discord.HTTPException as e:
+                self.logger.log_error(guild_id, "match_reminder_send", str(e))
     
     async def show_upcoming_matches(self, ctx, tournament: Tournament):
         """Show all upcoming scheduled matches"""
@@ -231,28 +322,25 @@ class SchedulingService:
         
         if not tournament.is_started:
             if is_interaction:
-                await ctx.response.send_message(ERROR_MESSAGES["TOURNAMENT_NOT_STARTED"])
+                await ctx.response.send_message(get_error("TOURNAMENT_NOT_STARTED"))
             else:
-                await ctx.send(ERROR_MESSAGES["TOURNAMENT_NOT_STARTED"])
+                await ctx.send(get_error("TOURNAMENT_NOT_STARTED"))
             return False
             
         # Get all pending matches with scheduled times
+        # Matches cache their parsed timestamp, so this is a plain numeric compare per match
         scheduled_matches = []
-        now = datetime.now()
+        now_ts = time.time()
         
         for match_id, match in tournament.matches.items():
-            if match.status != MatchStatus.PENDING or not match.scheduled_time:
-                continue
-                
-            try:
-                scheduled_time = datetime.fromisoformat(match.scheduled_time)
-                if scheduled_time > now:
-                    scheduled_matches.append((match_id, match, scheduled_time))
-            except:
+            if match.status != MatchStatus.PENDING:
                 continue
+            timestamp = match.scheduled_unix_ts
+            if timestamp is not None and timestamp > now_ts:
+                scheduled_matches.append((match_id, match, timestamp))
                 
         # Sort matches by scheduled time
-        scheduled_matches.sort(key=lambda x: x[2])
+        scheduled_matches.sort(key=itemgetter(2))
         
         if not scheduled_matches:
             if is_interaction:
@@ -269,14 +357,11 @@ class SchedulingService:
         )
         
         # Add each match to the embed
-        for match_id, match, scheduled_time in scheduled_matches:
-            player1 = await self.bot.fetch_user(match.player1)
-            player2 = await self.bot.fetch_user(match.player2)
-            
-            timestamp = int(scheduled_time.timestamp())
-            field_name = f"Match {match_id} - <t:{timestamp}:R>"
-            field_value = f"{player1.mention} vs {player2.mention}\n" \
-                         f"Time: <t:{timestamp}:F>\n" \
+        # Mentions render from the user ID alone, so no user lookups are needed
+        for match_id, match, _ in scheduled_matches:
+            field_name = f"Match {match_id} - {match.schedule_marker('R')}"
+            field_value = f"<@{match.player1}> vs <@{match.player2}>\n" \
+                         f"Time: {match.schedule_marker('F')}\n" \
                          f"Round {match.round_num} | Best of {tournament.config['best_of']}"
                          
             embed.add_field(
@@ -298,9 +383,14 @@ class SchedulingService:
         return True
             
     def cancel_all_reminders(self):
-        """Cancel all scheduled reminder tasks"""
-        for match_id, task in self.reminder_tasks.items():
-            if not task.done() and not task.cancelled():
-                task.cancel()
-                
-        self.reminder_tasks = {}
+        """Cancel all scheduled reminders and stop the background reminder and DM tasks"""
+        self._reminder_heap.clear()
+        self._reminder_due.clear()
+        if self._reminder_task is not None and not self._reminder_task.done():
+            self._reminder_task.cancel()
+        self._reminder_task = None
+        if self._dm_task is not None and not self._dm_task.done():
+            self._dm_task.cancel()
+        self._dm_task = None
+        for task in list(self._dm_sends):
+            task.cancel()
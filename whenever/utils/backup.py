@@ -1,43 +1,212 @@
-import json
+import asyncio
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from functools import partial
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple, Literal
+
+import orjson
+
+try:
+    import ormsgpack
+except ImportError:
+    ormsgpack = None
+
+SAVE_COALESCE_DELAY = 0.1  # Seconds to wait for further changes before writing a backup
+BURST_COALESCE_DELAY = 0.5  # Longer wait for changes that arrive in bursts, like registrations
+HISTORY_INTERVAL = 300  # Minimum seconds between history snapshots per guild
+HISTORY_KEEP = 5  # History snapshots kept per guild
+BACKUP_EXTENSIONS = {"json": "json", "msgpack": "msgpack"}
 
 class TournamentBackup:
-    def __init__(self, backup_dir: str = "tournament_backups"):
+    def __init__(self, backup_dir: str = "tournament_backups",
+                 format: Literal["json", "msgpack"] = "json"):
         self.backup_dir = Path(backup_dir)
         self.backup_dir.mkdir(exist_ok=True)
+        if format == "msgpack" and ormsgpack is None:
+            # ormsgpack is optional - keep writing JSON without it
+            format = "json"
+        self.format = format
+        self._extension = BACKUP_EXTENSIONS[format]
+        self._dirty: Dict[int, Any] = {}
+        self._flush_handles: Dict[int, asyncio.TimerHandle] = {}
+        # (tournament id, render version) last written per guild through flush, and the one being written
+        self._saved_versions: Dict[int, Tuple[str, int]] = {}
+        self._writing_versions: Dict[int, Tuple[str, int]] = {}
+        self._history: Dict[int, deque] = {}  # History snapshot paths per guild, oldest first
+        self._last_history: Dict[int, float] = {}
+        # Disk writes run off the event loop; one worker keeps them in submission order
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tournament_backup")
+        self._write_lock = threading.Lock()
+
+    def mark_dirty(self, guild_id: int, tournament, delay: float = SAVE_COALESCE_DELAY):
+        """Schedule a save of the tournament, merging saves requested within delay seconds"""
+        self._dirty[guild_id] = tournament
+        if guild_id in self._flush_handles:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to defer to - write straight away
+            self.flush(guild_id)
+            return
+        self._flush_handles[guild_id] = loop.call_later(delay, self.flush, guild_id)
+
+    def flush(self, guild_id: int, blocking: bool = False):
+        """Write a pending save for the guild, in the background unless blocking"""
+        tournament = self._dirty.get(guild_id)
+        if tournament is None:
+            return
+        self._cancel_pending(guild_id)
+        version = (tournament.meta["id"], tournament.render_version)
+        if self._saved_versions.get(guild_id) == version:
+            # Nothing changed since the last write - skip serializing it again
+            return
+        # Snapshot on the caller's thread; only encoding and disk I/O move to the executor
+        state_data = tournament.to_dict()
+        # Only counted as saved once the write succeeds, so a failed write is retried on the next flush
+        self._writing_versions[guild_id] = version
+        loop = None
+        if not blocking:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        if loop is None:
+            self._write_state(guild_id, state_data)
+            self._mark_saved(guild_id, version)
+            return
+        future = loop.run_in_executor(self._io_executor, self._write_state, guild_id, state_data)
+        future.add_done_callback(partial(self._flush_done, guild_id, version))
+
+    def flush_all(self):
+        """Write every pending save now"""
+        for guild_id in list(self._dirty):
+            self.flush(guild_id, blocking=True)
+
+    def close(self):
+        """Write pending saves and wait for background writes to finish"""
+        self.flush_all()
+        self._io_executor.shutdown(wait=True)
+
+    def _cancel_pending(self, guild_id: int):
+        """Drop the coalesced save waiting for the guild, if any"""
+        handle = self._flush_handles.pop(guild_id, None)
+        if handle is not None:
+            handle.cancel()
+        self._dirty.pop(guild_id, None)
+
+    def _mark_saved(self, guild_id: int, version: Tuple[str, int]):
+        """Record a flushed version as written, unless a direct save replaced the file since"""
+        if self._writing_versions.get(guild_id) == version:
+            del self._writing_versions[guild_id]
+            self._saved_versions[guild_id] = version
+
+    def _flush_done(self, guild_id: int, version: Tuple[str, int], future: asyncio.Future):
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logging.getLogger("TournamentBot").error(
+                "Failed to write tournament backup", exc_info=future.exception()
+            )
+            return
+        self._mark_saved(guild_id, version)
 
     def save_tournament_state(self, guild_id: int, state_data: Dict[str, Any]):
         """Save current tournament state"""
-        backup_file = self.backup_dir / f"tournament_{guild_id}.json"
+        # A direct save supersedes any coalesced save still waiting for this guild
+        self._cancel_pending(guild_id)
+        self._saved_versions.pop(guild_id, None)
+        self._writing_versions.pop(guild_id, None)
+        self._write_state(guild_id, state_data)
+
+    async def save_tournament_state_async(self, guild_id: int, state_data: Dict[str, Any]):
+        """Save current tournament state without blocking the event loop on disk I/O"""
+        self._cancel_pending(guild_id)
+        self._saved_versions.pop(guild_id, None)
+        self._writing_versions.pop(guild_id, None)
+        await asyncio.get_running_loop().run_in_executor(
+            self._io_executor, self._write_state, guild_id, state_data
+        )
+
+    def _write_state(self, guild_id: int, state_data: Dict[str, Any]):
+        """Encode and write a state snapshot to the live and history files"""
+        with self._write_lock:
+            self._write_state_locked(guild_id, state_data)
+
+    def _write_state_locked(self, guild_id: int, state_data: Dict[str, Any]):
+        now = time.time()
+        # Serialize once and write the same snapshot to the live and history files
+        payload = self._encode({
+            "last_updated": now,  # Epoch seconds
+            "state": state_data
+        })
+        backup_file = self.backup_dir / f"tournament_{guild_id}.{self._extension}"
         temp_file = self.backup_dir / f"tournament_{guild_id}.tmp"
-        with temp_file.open('w') as f:
-            json.dump({
-                "last_updated": datetime.now().isoformat(),
-                "state": state_data
-            }, f, indent=2)
+        temp_file.write_bytes(payload)
         temp_file.replace(backup_file)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        history_file = self.backup_dir / f"tournament_{guild_id}_{timestamp}.json"
-        with history_file.open('w') as f:
-            json.dump({
-                "last_updated": datetime.now().isoformat(),
-                "state": state_data
-            }, f, indent=2)
-        history_files = sorted(
-            self.backup_dir.glob(f"tournament_{guild_id}_*.json"),
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
-        )
-        for old_file in history_files[5:]:
-            old_file.unlink()
+        monotonic_now = time.monotonic()
+        last_history = self._last_history.get(guild_id)
+        if last_history is not None and monotonic_now - last_history < HISTORY_INTERVAL:
+            return
+        self._last_history[guild_id] = monotonic_now
+        history = self._get_history(guild_id)
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        history_file = self.backup_dir / f"tournament_{guild_id}_{timestamp}.{self._extension}"
+        # The live file is replaced (not rewritten) on the next save, so a hard link keeps this snapshot
+        history_file.unlink(missing_ok=True)
+        try:
+            os.link(backup_file, history_file)
+        except OSError:
+            # Filesystem without hard links
+            shutil.copyfile(backup_file, history_file)
+        if history and history[-1] == history_file:
+            return
+        if len(history) == history.maxlen:
+            history[0].unlink(missing_ok=True)
+        history.append(history_file)
+
+    def _get_history(self, guild_id: int) -> deque:
+        """History snapshots of a guild, read from disk the first time they are needed"""
+        history = self._history.get(guild_id)
+        if history is None:
+            existing = sorted(
+                self.backup_dir.glob(f"tournament_{guild_id}_*.{self._extension}"),
+                key=lambda x: x.stat().st_mtime
+            )
+            for old_file in existing[:-HISTORY_KEEP]:
+                old_file.unlink()
+            history = self._history[guild_id] = deque(existing[-HISTORY_KEEP:], maxlen=HISTORY_KEEP)
+        return history
+
+    def _encode(self, payload: Dict[str, Any]) -> bytes:
+        if self.format == "msgpack":
+            # msgpack keeps int keys as ints instead of coercing them to strings
+            return ormsgpack.packb(payload, option=ormsgpack.OPT_NON_STR_KEYS)
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
 
     def load_tournament_state(self, guild_id: int) -> Dict[str, Any]:
         """Load tournament state from backup"""
-        backup_file = self.backup_dir / f"tournament_{guild_id}.json"
-        if not backup_file.exists():
-            return {}
-        with backup_file.open('r') as f:
-            data = json.load(f)
+        # Prefer the configured format, falling back to a backup written in the other one
+        formats = sorted(BACKUP_EXTENSIONS, key=lambda name: name != self.format)
+        for name in formats:
+            if name == "msgpack" and ormsgpack is None:
+                continue
+            backup_file = self.backup_dir / f"tournament_{guild_id}.{BACKUP_EXTENSIONS[name]}"
+            if not backup_file.exists():
+                continue
+            raw = backup_file.read_bytes()
+            data = ormsgpack.unpackb(raw) if name == "msgpack" else orjson.loads(raw)
             return data.get("state", {})
+        return {}
+
+    async def load_tournament_state_async(self, guild_id: int) -> Dict[str, Any]:
+        """Load tournament state from backup on the write queue, after any save already queued"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._io_executor, self.load_tournament_state, guild_id
+        )
@@ -1,6 +1,7 @@
+from types import MappingProxyType
 from typing import TypedDict, Optional
 
-DEFAULT_TOURNAMENT_CONFIG = {
+_DEFAULT_TOURNAMENT_CONFIG_RAW = {
     "best_of": 3,
     "deck_check_required": False,
     "seeding_enabled": False,
@@ -16,15 +17,20 @@ DEFAULT_TOURNAMENT_CONFIG = {
     "send_reminders": True,  # Whether to send match reminders to players
     "reminder_minutes": 15   # How many minutes before match to send reminder
 }
+# Read-only view shared by every guild; per-guild changes are layered on top of it
+DEFAULT_TOURNAMENT_CONFIG = MappingProxyType(_DEFAULT_TOURNAMENT_CONFIG_RAW)
 
 MIN_PARTICIPANTS = 4
 
-VALID_DIMENSIONS = [
+# Screenshot sizes in both orientations, as a set for constant-time (width, height) lookups
+VALID_DIMENSIONS = frozenset({
     (1080, 1920),  # Common mobile resolution
     (1920, 1080),  # Landscape mobile
     (2436, 1125),  # iPhone X and similar
+    (1125, 2436),
     (2688, 1242),  # iPhone XS Max and similar
-]
+    (1242, 2688),
+})
 
 class MatchStatus:
     PENDING = "pending"
@@ -82,13 +88,13 @@ class VerificationStatus:
 ERROR_MESSAGES = {
     "NO_TOURNAMENT_ROLE": "Tournament role has not been set. An admin must use `/set_tournament_role` first.",
     "NO_MODERATOR": "At least one moderator with tournament role is required to facilitate the tournament.",
-    "INSUFFICIENT_PARTICIPANTS": lambda count: f"Not enough participants (minimum {MIN_PARTICIPANTS}, current: {count})",
+    "INSUFFICIENT_PARTICIPANTS": f"Not enough participants (minimum {MIN_PARTICIPANTS}, current: {{count}})",
     "TOURNAMENT_IN_PROGRESS": "A tournament is already in progress!",
     "REGISTRATION_CLOSED": "Registration is currently closed!",
     "ALREADY_REGISTERED": "You are already registered!",
     "DECK_REQUIRED": "Deck screenshots are required for this tournament! Please provide your deck images.",
     "NO_MATCH_FOUND": "No active match found between you and this opponent.",
-    "INVALID_SCORE": lambda best_of: f"Invalid score. This is a best of {best_of} match.",
+    "INVALID_SCORE": "Invalid score. This is a best of {best_of} match.",
     "NOT_AUTHORIZED": "You are not authorized to perform this action.",
     "TOURNAMENT_NOT_STARTED": "No tournament is currently in progress!",
     "MATCH_REQUIRES_CONFIRMATION": "This match result needs to be confirmed by your opponent.",
@@ -98,11 +104,21 @@ ERROR_MESSAGES = {
     "PLAYER_INACTIVE": "This player is no longer active in the tournament."
 }
 
+def get_error(key: str, **kwargs) -> str:
+    """Get an error message, filling in its placeholders from kwargs"""
+    template = ERROR_MESSAGES[key]
+    return template.format_map(kwargs) if kwargs else template
+
 ROUND_MESSAGES = {
-    "COMPLETE": lambda round_num: f"Round {round_num} complete! Starting Round {round_num + 1}...",
-    "SWISS_COMPLETE": lambda top_cut: f"Swiss rounds complete! Top {top_cut} advancing to elimination bracket.",
+    "COMPLETE": "Round {round_num} complete! Starting Round {next_round}...",
+    "SWISS_COMPLETE": "Swiss rounds complete! Top {top_cut} advancing to elimination bracket.",
     "TOURNAMENT_COMPLETE": "🏆 Tournament Complete! 🏆",
-    "MATCH_SCHEDULED": lambda p1, p2, time: f"Match scheduled: {p1.mention} vs {p2.mention} at {time}",
-    "MATCH_REMINDER": lambda p1, p2: f"Reminder: {p1.mention} vs {p2.mention} match is due soon!",
-    "MATCH_TIMEOUT_WARNING": lambda p1, p2: f"Warning: {p1.mention} vs {p2.mention} match is about to time out!"
+    "MATCH_SCHEDULED": "Match scheduled: {p1} vs {p2} at {time}",
+    "MATCH_REMINDER": "Reminder: {p1} vs {p2} match is due soon!",
+    "MATCH_TIMEOUT_WARNING": "Warning: {p1} vs {p2} match is about to time out!"
 }
+
+def get_round_message(key: str, **kwargs) -> str:
+    """Get a round message, filling in its placeholders from kwargs (players as mention strings)"""
+    template = ROUND_MESSAGES[key]
+    return template.format_map(kwargs) if kwargs else template
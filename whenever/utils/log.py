@@ -2,7 +2,26 @@ import logging
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# Prebuilt JSON line templates for the hottest event types; formatted lazily
+# by the logging module so no intermediate dicts are built per event.
+_MATCH_RESULT_TEMPLATE = (
+    '{"guild_id": %d, "event_type": "match_result", "timestamp": "%s", '
+    '"data": {"match_id": %d, "winner_id": %d, "loser_id": %d, "score": %s}}'
+)
+_DECK_SUBMISSION_TEMPLATE = (
+    '{"guild_id": %d, "event_type": "deck_submission", "timestamp": "%s", '
+    '"data": {"user_id": %d, "deck_info": %s}}'
+)
+_BYE_GRANTED_TEMPLATE = (
+    '{"guild_id": %d, "event_type": "bye_granted", "timestamp": "%s", '
+    '"data": {"player_id": %d, "round": %d}}'
+)
+_BYE_GRANTED_BRACKET_TEMPLATE = (
+    '{"guild_id": %d, "event_type": "bye_granted", "timestamp": "%s", '
+    '"data": {"player_id": %d, "round": %d, "bracket": %s}}'
+)
 
 class TournamentLogger:
     def __init__(self, log_dir: str = "tournament_logs"):
@@ -18,6 +37,8 @@ class TournamentLogger:
 
     def log_tournament_event(self, guild_id: int, event_type: str, data: Dict[str, Any]):
         """Log tournament events with structured data"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return  # Skip building and encoding an entry nobody will see
         log_entry = {
             "guild_id": guild_id,
             "event_type": event_type,
@@ -28,19 +49,30 @@ class TournamentLogger:
 
     def log_deck_submission(self, guild_id: int, user_id: int, deck_info: Dict[str, Any]):
         """Log deck submissions"""
-        self.log_tournament_event(guild_id, "deck_submission", {
-            "user_id": user_id,
-            "deck_info": deck_info
-        })
+        self.logger.info(
+            _DECK_SUBMISSION_TEMPLATE,
+            guild_id, datetime.now().isoformat(), user_id, json.dumps(deck_info)
+        )
 
     def log_match_result(self, guild_id: int, match_id: int, winner_id: int, loser_id: int, score: str):
         """Log match results"""
-        self.log_tournament_event(guild_id, "match_result", {
-            "match_id": match_id,
-            "winner_id": winner_id,
-            "loser_id": loser_id,
-            "score": score
-        })
+        self.logger.info(
+            _MATCH_RESULT_TEMPLATE,
+            guild_id, datetime.now().isoformat(), match_id, winner_id, loser_id, json.dumps(score)
+        )
+
+    def log_bye_granted(self, guild_id: int, player_id: int, round_num: int, bracket: Optional[str] = None):
+        """Log byes granted to unpaired players, with the bracket for formats that have several"""
+        if bracket is None:
+            self.logger.info(
+                _BYE_GRANTED_TEMPLATE,
+                guild_id, datetime.now().isoformat(), player_id, round_num
+            )
+            return
+        self.logger.info(
+            _BYE_GRANTED_BRACKET_TEMPLATE,
+            guild_id, datetime.now().isoformat(), player_id, round_num, json.dumps(bracket)
+        )
 
     def log_error(self, guild_id: int, error_type: str, error_msg: str):
         """Log errors"""
@@ -48,3 +80,7 @@ class TournamentLogger:
             "error_type": error_type,
             "error_message": error_msg
         })
+
+    def log_exception(self, guild_id: int, error_type: str, msg: str, *args):
+        """Log the exception being handled with its traceback; msg is %-formatted only if emitted"""
+        self.logger.exception("guild %s %s: " + msg, guild_id, error_type, *args)
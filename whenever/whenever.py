@@ -1,7 +1,8 @@
 from redbot.core import commands, Config
 import discord
-from typing import Dict, Optional, List, Union
+from typing import Dict, Optional, List, Union, Tuple
 from datetime import datetime
+from functools import partial
 import asyncio
 import os
 from .constants import (
@@ -24,6 +25,18 @@ class DuelLinksTournament(commands.Cog):
     """
     Duel Links Tournament Manager - For organizing Yu-Gi-Oh! Duel Links tournaments
     """
+    # Validation tables for command arguments, built once
+    _VALID_MODES = frozenset({
+        TournamentMode.SINGLE_ELIMINATION, TournamentMode.DOUBLE_ELIMINATION,
+        TournamentMode.SWISS, TournamentMode.ROUND_ROBIN
+    })
+    _VALID_MODES_STR = ", ".join((
+        TournamentMode.SINGLE_ELIMINATION, TournamentMode.DOUBLE_ELIMINATION,
+        TournamentMode.SWISS, TournamentMode.ROUND_ROBIN
+    ))
+    _VALID_SETTINGS_STR = ", ".join(DEFAULT_TOURNAMENT_CONFIG)
+    _TRUTHY = frozenset({"true", "yes", "on", "enable", "enabled"})
+    _FALSY = frozenset({"false", "no", "off", "disable", "disabled"})
     
     def __init__(self, bot):
         self.bot = bot
@@ -38,6 +51,7 @@ class DuelLinksTournament(commands.Cog):
             "use_threads": True,
             "tournament_threads": {},  # {user_id: thread_id}
             "tournament_channels": {},  # {user_id: channel_id}
+            "tournament_config": {},  # Settings changed with the config command, over the defaults
             "active_tournaments": {}   # {tournament_id: tournament_data}
         }
         
@@ -49,20 +63,89 @@ class DuelLinksTournament(commands.Cog):
         self.logger = TournamentLogger(log_dir)
         self.backup = TournamentBackup(backup_dir)
         self.tournament_manager = TournamentManager(bot, self.logger, self.backup)
-        
-        # Load guild settings
-        self.bot.loop.create_task(self._load_guild_settings())
+        # Guilds whose private channel/thread mappings changed since they were last written to Config
+        self._dirty_mappings = set()
+        self._mapping_writes: Dict[int, asyncio.Task] = {}
+        # Setting writes still running, kept referenced until they finish
+        self._pending_writes = set()
+        self._settings_task: Optional[asyncio.Task] = None
+    
+    async def cog_load(self):
+        # Load guild settings once the bot is ready, without holding up the cog load itself
+        self._settings_task = asyncio.create_task(self._load_guild_settings())
+    
+    def cog_unload(self):
+        if self._settings_task is not None:
+            self._settings_task.cancel()
+        # Stop background reminders and DMs so a reloaded cog doesn't send them twice
+        self.tournament_manager.scheduling_service.cancel_all_reminders()
+        self.tournament_manager.registration_service.cancel_pending_dms()
+        # Write out any backups still waiting to be coalesced
+        self.backup.close()
     
     async def _load_guild_settings(self):
         await self.bot.wait_until_ready()
         # Load guild settings
         all_guilds = await self.config.all_guilds()
         for guild_id, settings in all_guilds.items():
-            self.tournament_manager.guild_settings[guild_id] = settings
+            # Keep settings a command already read (and maybe changed) while we were waiting
+            self.tournament_manager.guild_settings.setdefault(guild_id, settings)
         
         # Load tournament states
         await self.tournament_manager.load_states(self.bot.guilds)
     
+    async def _get_guild_settings(self, guild: discord.Guild) -> dict:
+        """Get a guild's cached settings, reading them from Config on first use"""
+        settings = self.tournament_manager.guild_settings.get(guild.id)
+        if settings is None:
+            settings = await self.config.guild(guild).all()
+            settings = self.tournament_manager.guild_settings.setdefault(guild.id, settings)
+        return settings
+    
+    async def _save_setting(self, guild: discord.Guild, key: str, value):
+        """Update a cached guild setting and write it to Config without waiting for the write"""
+        settings = await self._get_guild_settings(guild)
+        settings[key] = value
+        task = asyncio.create_task(self.config.guild(guild).get_attr(key).set(value))
+        self._pending_writes.add(task)
+        task.add_done_callback(partial(self._setting_written, guild, key))
+    
+    def _setting_written(self, guild: discord.Guild, key: str, task: asyncio.Task):
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.log_error(guild.id, "setting_save_failed", f"Failed to save {key}: {task.exception()}")
+    
+    async def _get_private_mappings(self, guild: discord.Guild) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Get the cached {user_id: thread_id} and {user_id: channel_id} mappings for a guild"""
+        settings = await self._get_guild_settings(guild)
+        return (settings.setdefault("tournament_threads", {}),
+                settings.setdefault("tournament_channels", {}))
+    
+    def _save_private_mappings(self, guild: discord.Guild):
+        """Write a guild's private channel/thread mappings to Config in the background"""
+        self._dirty_mappings.add(guild.id)
+        if guild.id not in self._mapping_writes:
+            task = asyncio.create_task(self._write_private_mappings(guild))
+            self._mapping_writes[guild.id] = task
+            task.add_done_callback(partial(self._private_mappings_written, guild))
+    
+    async def _write_private_mappings(self, guild: discord.Guild):
+        # Changes made while a write is in flight are picked up by the next pass
+        group = self.config.guild(guild)
+        while guild.id in self._dirty_mappings:
+            self._dirty_mappings.discard(guild.id)
+            thread_mapping, channel_mapping = await self._get_private_mappings(guild)
+            await group.tournament_threads.set(thread_mapping)
+            await group.tournament_channels.set(channel_mapping)
+    
+    def _private_mappings_written(self, guild: discord.Guild, task: asyncio.Task):
+        del self._mapping_writes[guild.id]
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.log_error(guild.id, "mapping_save_failed", f"Failed to save private channels: {task.exception()}")
+        elif guild.id in self._dirty_mappings:
+            # Marked dirty after the last pass finished but before this callback ran
+            self._save_private_mappings(guild)
+    
     @commands.guild_only()
     @commands.group(name="whenever", aliases=["dlt", "tournament"])
     async def whenever(self, ctx):
@@ -86,14 +169,12 @@ class DuelLinksTournament(commands.Cog):
         - best_of: Number of games in a match (3, 5, 7, etc.)
         """
         # Validate tournament mode
-        valid_modes = [TournamentMode.SINGLE_ELIMINATION, TournamentMode.DOUBLE_ELIMINATION, 
-                     TournamentMode.SWISS, TournamentMode.ROUND_ROBIN]
-        
-        if tournament_mode not in valid_modes:
-            await ctx.send(f"Invalid tournament mode. Valid options are: {', '.join(valid_modes)}")
+        if tournament_mode not in self._VALID_MODES:
+            await ctx.send(f"Invalid tournament mode. Valid options are: {self._VALID_MODES_STR}")
             return
         
-        # Create the tournament
+        # Make sure the guild's config overrides are loaded, then create the tournament
+        await self._get_guild_settings(ctx.guild)
         await self.tournament_manager.create_tournament(
             ctx,
             name=name,
@@ -196,9 +277,7 @@ class DuelLinksTournament(commands.Cog):
         # This command doesn't need to be in a private channel, but can be redirected there if user already has one
         
         # Check if the user has a private channel
-        guild_settings = self.tournament_manager.guild_settings.get(ctx.guild.id, {})
-        thread_mapping = await self.config.guild(ctx.guild).tournament_threads()
-        channel_mapping = await self.config.guild(ctx.guild).tournament_channels()
+        thread_mapping, channel_mapping = await self._get_private_mappings(ctx.guild)
         
         private_channel = None
         
@@ -292,29 +371,31 @@ class DuelLinksTournament(commands.Cog):
         - [p]whenever config best_of 5
         - [p]whenever config rounds_swiss 4
         """
-        if setting not in self.tournament_manager.tournament_config:
-            valid_settings = ", ".join(self.tournament_manager.tournament_config.keys())
-            await ctx.send(f"Invalid setting. Valid options are: {valid_settings}")
+        if setting not in DEFAULT_TOURNAMENT_CONFIG:
+            await ctx.send(f"Invalid setting. Valid options are: {self._VALID_SETTINGS_STR}")
             return
         
+        # Overrides are per guild and kept in Config, apart from the tournament backup
+        settings = await self._get_guild_settings(ctx.guild)
+        overrides = dict(settings.get("tournament_config") or {})
+        
         # Handle different setting types
-        if value.lower() in ["true", "yes", "on", "enable", "enabled"]:
-            self.tournament_manager.tournament_config[setting] = True
-        elif value.lower() in ["false", "no", "off", "disable", "disabled"]:
-            self.tournament_manager.tournament_config[setting] = False
+        lowered = value.lower()
+        if lowered in self._TRUTHY:
+            overrides[setting] = True
+        elif lowered in self._FALSY:
+            overrides[setting] = False
         else:
             try:
                 if "." in value:
-                    self.tournament_manager.tournament_config[setting] = float(value)
+                    overrides[setting] = float(value)
                 else:
-                    self.tournament_manager.tournament_config[setting] = int(value)
+                    overrides[setting] = int(value)
             except ValueError:
-                self.tournament_manager.tournament_config[setting] = value
+                overrides[setting] = value
         
         # Save configuration
-        self.tournament_manager.backup.save_tournament_state(ctx.guild.id, {
-            "tournament_config": self.tournament_manager.tournament_config
-        })
+        await self._save_setting(ctx.guild, "tournament_config", overrides)
         
         await ctx.send(f"Tournament setting `{setting}` set to `{value}`")
     
@@ -338,13 +419,8 @@ class DuelLinksTournament(commands.Cog):
         
         Players need this role to register for tournaments
         """
-        # Update guild settings
-        guild_settings = self.tournament_manager.guild_settings.get(ctx.guild.id, {})
-        guild_settings["tournament_role_id"] = role.id
-        self.tournament_manager.guild_settings[ctx.guild.id] = guild_settings
-        
-        # Save to config
-        await self.config.guild(ctx.guild).tournament_role_id.set(role.id)
+        # Update guild settings; Config is written in the background
+        await self._save_setting(ctx.guild, "tournament_role_id", role.id)
         
         await ctx.send(f"Tournament role set to {role.mention}")
     
@@ -356,13 +432,8 @@ class DuelLinksTournament(commands.Cog):
         
         Users with this role can manage tournaments even without admin permissions
         """
-        # Update guild settings
-        guild_settings = self.tournament_manager.guild_settings.get(ctx.guild.id, {})
-        guild_settings["mod_role_id"] = role.id
-        self.tournament_manager.guild_settings[ctx.guild.id] = guild_settings
-        
-        # Save to config
-        await self.config.guild(ctx.guild).mod_role_id.set(role.id)
+        # Update guild settings; Config is written in the background
+        await self._save_setting(ctx.guild, "mod_role_id", role.id)
         
         await ctx.send(f"Tournament moderator role set to {role.mention}")
     
@@ -378,13 +449,8 @@ class DuelLinksTournament(commands.Cog):
         if channel is None:
             channel = ctx.channel
         
-        # Update guild settings
-        guild_settings = self.tournament_manager.guild_settings.get(ctx.guild.id, {})
-        guild_settings["tournament_channel_id"] = channel.id
-        self.tournament_manager.guild_settings[ctx.guild.id] = guild_settings
-        
-        # Save to config
-        await self.config.guild(ctx.guild).tournament_channel_id.set(channel.id)
+        # Update guild settings; Config is written in the background
+        await self._save_setting(ctx.guild, "tournament_channel_id", channel.id)
         
         await ctx.send(f"Tournament channel set to {channel.mention}")
         
@@ -400,13 +466,8 @@ class DuelLinksTournament(commands.Cog):
         if channel is None:
             channel = ctx.channel
         
-        # Update guild settings
-        guild_settings = self.tournament_manager.guild_settings.get(ctx.guild.id, {})
-        guild_settings["announcement_channel_id"] = channel.id
-        self.tournament_manager.guild_settings[ctx.guild.id] = guild_settings
-        
-        # Save to config
-        await self.config.guild(ctx.guild).announcement_channel_id.set(channel.id)
+        # Update guild settings; Config is written in the background
+        await self._save_setting(ctx.guild, "announcement_channel_id", channel.id)
         
         await ctx.send(f"Tournament announcement channel set to {channel.mention}")
     
@@ -418,13 +479,8 @@ class DuelLinksTournament(commands.Cog):
         
         Private channels for tournament participants will be created in this category
         """
-        # Update guild settings
-        guild_settings = self.tournament_manager.guild_settings.get(ctx.guild.id, {})
-        guild_settings["tournament_category_id"] = category.id
-        self.tournament_manager.guild_settings[ctx.guild.id] = guild_settings
-        
-        # Save to config
-        await self.config.guild(ctx.guild).tournament_category_id.set(category.id)
+        # Update guild settings; Config is written in the background
+        await self._save_setting(ctx.guild, "tournament_category_id", category.id)
         
         await ctx.send(f"Tournament category set to {category.mention}")
     
@@ -437,13 +493,8 @@ class DuelLinksTournament(commands.Cog):
         Arguments:
         - use_threads: True to use threads, False to use channels
         """
-        # Update guild settings
-        guild_settings = self.tournament_manager.guild_settings.get(ctx.guild.id, {})
-        guild_settings["use_threads"] = use_threads
-        self.tournament_manager.guild_settings[ctx.guild.id] = guild_settings
-        
-        # Save to config
-        await self.config.guild(ctx.guild).use_threads.set(use_threads)
+        # Update guild settings; Config is written in the background
+        await self._save_setting(ctx.guild, "use_threads", use_threads)
         
         mode_str = "threads" if use_threads else "channels"
         await ctx.send(f"Tournament communication mode set to use {mode_str}")
@@ -457,8 +508,7 @@ class DuelLinksTournament(commands.Cog):
         If a player is specified, only their channel/thread will be removed.
         If no player is specified, all inactive channels/threads will be removed.
         """
-        thread_mapping = await self.config.guild(ctx.guild).tournament_threads()
-        channel_mapping = await self.config.guild(ctx.guild).tournament_channels()
+        thread_mapping, channel_mapping = await self._get_private_mappings(ctx.guild)
         
         if player:
             # Remove specific player's channel/thread
@@ -522,12 +572,11 @@ class DuelLinksTournament(commands.Cog):
             await ctx.send(f"Cleanup complete. Removed {deleted_threads} threads and {deleted_channels} channels.")
         
         # Save updated mappings
-        await self.config.guild(ctx.guild).tournament_threads.set(thread_mapping)
-        await self.config.guild(ctx.guild).tournament_channels.set(channel_mapping)
+        self._save_private_mappings(ctx.guild)
     
     async def _create_or_get_private_channel(self, ctx) -> Union[discord.TextChannel, discord.Thread, None]:
         """Create or get a private channel/thread for tournament interaction"""
-        guild_settings = self.tournament_manager.guild_settings.get(ctx.guild.id, {})
+        guild_settings = await self._get_guild_settings(ctx.guild)
         tournament_role_id = guild_settings.get("tournament_role_id")
         tournament_role = None
         mod_role_id = guild_settings.get("mod_role_id")
@@ -540,8 +589,7 @@ class DuelLinksTournament(commands.Cog):
             mod_role = ctx.guild.get_role(mod_role_id)
         
         # Get user's existing channel/thread if it exists
-        thread_mapping = await self.config.guild(ctx.guild).tournament_threads()
-        channel_mapping = await self.config.guild(ctx.guild).tournament_channels()
+        thread_mapping, channel_mapping = await self._get_private_mappings(ctx.guild)
         
         # Check if user already has a thread
         if str(ctx.author.id) in thread_mapping:
@@ -552,7 +600,7 @@ class DuelLinksTournament(commands.Cog):
             else:
                 # Thread was deleted or inaccessible, remove from mapping
                 del thread_mapping[str(ctx.author.id)]
-                await self.config.guild(ctx.guild).tournament_threads.set(thread_mapping)
+                self._save_private_mappings(ctx.guild)
         
         # Check if user already has a channel
         if str(ctx.author.id) in channel_mapping:
@@ -563,7 +611,7 @@ class DuelLinksTournament(commands.Cog):
             else:
                 # Channel was deleted or inaccessible, remove from mapping
                 del channel_mapping[str(ctx.author.id)]
-                await self.config.guild(ctx.guild).tournament_channels.set(channel_mapping)
+                self._save_private_mappings(ctx.guild)
         
         # Determine if we should use threads or channels
         use_threads = guild_settings.get("use_threads", True)
@@ -604,26 +652,21 @@ class DuelLinksTournament(commands.Cog):
                     # Make the thread accessible to the user and staff
                     await thread.add_user(ctx.author)
                     
-                    # Add tournament staff if applicable
-                    if tournament_role:
-                        for member in ctx.guild.members:
-                            if tournament_role in member.roles and member.id != ctx.author.id:
-                                try:
-                                    await thread.add_user(member)
-                                except:
-                                    pass
-                    
-                    if mod_role:
-                        for member in ctx.guild.members:
-                            if mod_role in member.roles and member.id != ctx.author.id:
-                                try:
-                                    await thread.add_user(member)
-                                except:
-                                    pass
+                    # Add tournament staff if applicable, once each even if they hold both roles
+                    staff = {}
+                    for role in (tournament_role, mod_role):
+                        if role:
+                            staff.update((member.id, member) for member in role.members)
+                    staff.pop(ctx.author.id, None)
+                    # Staff who can't be added are skipped without holding up the others
+                    await asyncio.gather(
+                        *(thread.add_user(member) for member in staff.values()),
+                        return_exceptions=True
+                    )
                     
                     # Store the thread ID
                     thread_mapping[str(ctx.author.id)] = thread.id
-                    await self.config.guild(ctx.guild).tournament_threads.set(thread_mapping)
+                    self._save_private_mappings(ctx.guild)
                     
                     # Send welcome message
                     await thread.send(f"Welcome to your private tournament thread, {ctx.author.mention}! "
@@ -681,7 +724,7 @@ class DuelLinksTournament(commands.Cog):
                     
                     # Store the channel ID
                     channel_mapping[str(ctx.author.id)] = channel.id
-                    await self.config.guild(ctx.guild).tournament_channels.set(channel_mapping)
+                    self._save_private_mappings(ctx.guild)
                     
                     # Send welcome message
                     await channel.send(f"Welcome to your private tournament channel, {ctx.author.mention}! "
@@ -702,6 +745,16 @@ class DuelLinksTournament(commands.Cog):
             await ctx.send(f"An error occurred: {str(e)}")
             return None
     
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before, after):
+        """Stop using a cached copy of an updated role"""
+        self.tournament_manager.forget_role(after)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        """Stop using a cached copy of a deleted role"""
+        self.tournament_manager.forget_role(role)
+    
     @commands.Cog.listener()
     async def on_member_update(self, before, after):
         """Handle member role updates"""